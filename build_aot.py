@@ -0,0 +1,30 @@
+"""Ahead-of-time compile the Numba kernels of :mod:`condensation.core`.
+
+Run ``python build_aot.py`` (requires numba and a C compiler) to build the
+``condensation/condensation_kernels`` extension. When it is present,
+``condensation.core`` loads it instead of JIT-compiling the kernels on first
+use; without it everything works as before.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+
+def build() -> None:
+    from numba.pycc import CC
+
+    from condensation import core
+
+    cc = CC("condensation_kernels")
+    cc.output_dir = str(ROOT / "condensation")
+    for name, (kernel, signature) in core._AOT_EXPORTS.items():
+        cc.export(name, signature)(getattr(kernel, "py_func", kernel))
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -1,22 +1,48 @@
 from .dataclasses import Layer, Assembly, Climate
-from typing import List, Tuple, Optional, Dict
+from typing import List, NamedTuple, Tuple, Optional, Dict, Sequence
+import atexit
+import json
 import math
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import cast
 
+import numpy as np
+
 try:
     # Optional tables module providing normative lookups
-    from .tables import p_max_tabulated, theta_s_tabulated  # type: ignore
+    from .tables import (  # type: ignore
+        p_max_tabulated,
+        p_max_tabulated_vec,
+        theta_s_tabulated,
+        theta_s_tabulated_vec,
+    )
     _HAS_TABLES = True
 except Exception:  # pragma: no cover - optional dependency
     p_max_tabulated = None  # type: ignore
+    p_max_tabulated_vec = None  # type: ignore
     theta_s_tabulated = None  # type: ignore
+    theta_s_tabulated_vec = None  # type: ignore
     _HAS_TABLES = False
 
+try:  # Optional JIT compilation of the numeric kernels
+    from numba import njit
+except Exception:  # pragma: no cover - optional dependency
+    def njit(*args, **kwargs):  # type: ignore
+        """No-op stand-in for :func:`numba.njit`; kernels run as plain NumPy."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
 
+@lru_cache(maxsize=256)
 def u_value(assembly: Assembly) -> Tuple[float, float]:
     """Return (U, R_total) where R_total includes Rsi, layers, and Rse."""
-    R_layers = sum(layer.d / layer.lambda_ for layer in assembly.layers)
-    R_total = assembly.Rsi + R_layers + assembly.Rse
+    arrs = assembly._arrays()
+    if not arrs.lambda_.all():
+        raise ZeroDivisionError("float division by zero")
+    R_total = assembly.Rsi + assembly._R_layers + assembly.Rse
     U = 1.0 / R_total if R_total > 0 else float('inf')
     return U, R_total
 
@@ -29,37 +55,95 @@ def temperature_profile(assembly: Assembly, climate: Climate) -> List[float]:
     included in between. For constructions without layers the result is
     ``[θsi, θse]``.
     """
+    return _compute_core(assembly, climate).temps.tolist()
+
+
+class _Core(NamedTuple):
+    """Everything :func:`analyze` needs from one assembly/climate pair.
+
+    Profiles are read-only float64 arrays over the surfaces/interfaces.
+    """
+
+    U: float
+    R_total: float
+    q: float  # heat flux density [W/m²], NaN for degenerate stacks
+    temps: np.ndarray  # θsi, interfaces, θse [°C]
+    thickness: np.ndarray  # x = Σd [m]
+    z_axis: np.ndarray  # z = Σμd/δ_air [m²·Pa·h/kg]
+    p_lin: np.ndarray  # linear p(z) [Pa]
+    p_sat: np.ndarray  # p_max(θ) [Pa]
+    p_i: float
+    p_e: float
+
+
+class _Plan(NamedTuple):
+    """Climate-independent quantities of an assembly, computed once."""
+
+    U: float
+    R_total: float
+    z_axis: np.ndarray  # z = Σμd/δ_air [m²·Pa·h/kg], read-only
+    thickness: np.ndarray  # x = Σd [m], read-only
+    g_dry: float  # drying flux under the normative drying climate [kg/(m²·h)]
+
+
+@lru_cache(maxsize=256)
+def _assembly_plan(assembly: Assembly) -> _Plan:
     U, R_total = u_value(assembly)
+    z_axis = np.array(_z_profile(assembly))
+    thickness = np.concatenate(([0.0], np.cumsum(assembly._arrays().d)))
+    z_axis.flags.writeable = False
+    thickness.flags.writeable = False
+    s_total = float(z_axis[-1]) if assembly.layers else 0.0
+    if s_total > 0:
+        p_i, p_e = partial_pressures(_DRYING_CLIMATE)
+        g_dry = abs(p_i - p_e) / s_total
+    else:
+        g_dry = 0.0
+    return _Plan(U, R_total, z_axis, thickness, g_dry)
+
+
+@lru_cache(maxsize=256)
+def _compute_core(assembly: Assembly, climate: Climate) -> _Core:
+    """Compute U, temperatures, p(z) and p_sat in one pass over shared arrays."""
+    return _core_from_plan(_assembly_plan(assembly), assembly, climate)
+
+
+def _core_from_plan(plan: _Plan, assembly: Assembly, climate: Climate) -> _Core:
+    """Uncached :func:`_compute_core` on an already evaluated plan."""
+    U, R_total = plan.U, plan.R_total
     if not math.isfinite(U) or R_total == 0:
         # Degenerate case: return at least both surface temperatures
-        temps = [climate.theta_i] * (len(assembly.layers) + 1)
-        temps.append(climate.theta_e)
-        return temps
+        q = float("nan")
+        temps = np.full(len(assembly.layers) + 2, climate.theta_i, dtype=np.float64)
+        temps[-1] = climate.theta_e
+    else:
+        # Heat flux density (W/m^2)
+        q = U * (climate.theta_i - climate.theta_e)
+        # θsi followed by the interface after each layer (from inside to outside)
+        temps = climate.theta_i - q * (assembly.Rsi + assembly._R_cum)
+        theta_se = _theta_se(assembly, climate, q)
+        if assembly.layers:
+            # Replace the last interface temperature with θse
+            temps[-1] = theta_se
+        else:
+            # No layers: append θse so both surfaces are present
+            temps = np.append(temps, theta_se)
 
-    # Heat flux density (W/m^2)
-    q = U * (climate.theta_i - climate.theta_e)
+    p_i, p_e = partial_pressures(climate)
+    p_lin = _vapor_pressure_line(plan.z_axis, p_i, p_e)
+    p_sat = _p_max_array(temps)
+    for arr in (temps, p_lin, p_sat):
+        arr.flags.writeable = False
+    return _Core(U, R_total, q, temps, plan.thickness, plan.z_axis, p_lin, p_sat, p_i, p_e)
+
+
+def _theta_se(assembly: Assembly, climate: Climate, q: float) -> float:
+    """External surface temperature θse = θe + q·Rse for heat flux ``q``."""
+    return climate.theta_e + q * assembly.Rse
 
-    # Internal surface temperature
-    theta_si = climate.theta_i - q * assembly.Rsi
-    temps = [theta_si]
-
-    # Interface temperatures after each layer (from inside to outside)
-    R_accum = assembly.Rsi
-    for layer in assembly.layers:
-        R_accum += layer.d / layer.lambda_
-        theta_interface = climate.theta_i - q * R_accum
-        temps.append(theta_interface)
-
-    # External surface temperature using Rse (θse)
-    theta_se = climate.theta_e + q * assembly.Rse
-    if assembly.layers:
-        # Replace the last interface temperature with θse
-        temps[-1] = theta_se
-    else:
-        # No layers: append θse so both surfaces are present
-        temps.append(theta_se)
-    return temps
 
+# Normative drying-period climate: θi = θe = 18°C, φi = φe = 65%
+_DRYING_CLIMATE = Climate(theta_i=18.0, phi_i=65.0, theta_e=18.0, phi_e=65.0)
 
 # Vapor permeability of still air at ~10°C in kg/(m·h·Pa)
 DELTA_AIR_KG_M_H_PA = 1.86e-7
@@ -70,12 +154,13 @@ def z_profile(assembly: Assembly) -> List[float]:
 
     Units: m²·Pa·h/kg
     """
-    z = [0.0]
-    accum = 0.0
-    for layer in assembly.layers:
-        accum += (layer.mu * layer.d) / DELTA_AIR_KG_M_H_PA
-        z.append(accum)
-    return z
+    return list(_z_profile(assembly))
+
+
+@lru_cache(maxsize=256)
+def _z_profile(assembly: Assembly) -> Tuple[float, ...]:
+    arrs = assembly._arrays()
+    return tuple(np.concatenate(([0.0], np.cumsum(arrs.mu * arrs.d) / DELTA_AIR_KG_M_H_PA)).tolist())
 
 
 def thickness_axis(assembly: Assembly) -> List[float]:
@@ -85,44 +170,234 @@ def thickness_axis(assembly: Assembly) -> List[float]:
     - Adds d for each layer to the next interface.
     - Returns [0, after L1, ..., total_thickness]
     """
-    xs = [0.0]
-    accum = 0.0
-    for layer in assembly.layers:
-        accum += layer.d
-        xs.append(accum)
-    return xs
+    return np.concatenate(([0.0], np.cumsum(assembly._arrays().d))).tolist()
 
 
+@njit(cache=True)
 def _p_max_magnus_pa(T: float) -> float:
     """Saturation vapor pressure over water in Pa using Magnus-Tetens approximation."""
     a = 17.625
     b = 243.04  # °C
-    es_hPa = 6.112 * math.exp(a * T / (b + T))  # hPa
-    return es_hPa * 100.0  # Pa
+    return 611.2 * math.exp(a * T / (b + T))  # 6.112 hPa -> Pa
+
+
+@njit(cache=True)
+def _p_max_magnus_vec(T: np.ndarray) -> np.ndarray:
+    """:func:`_p_max_magnus_pa` over a float64 array."""
+    out = np.empty_like(T)
+    for i in range(T.shape[0]):
+        out[i] = 611.2 * math.exp(17.625 * T[i] / (243.04 + T[i]))
+    return out
+
+
+# Flatau et al. (1992) 6th-order fit of saturation pressure over water [hPa],
+# valid for -50..+50 °C; closer to Tab. 2.2 above 0 °C than Magnus.
+_FLATAU6 = (
+    6.11176750,
+    0.443986062,
+    0.143053301e-1,
+    0.265027242e-3,
+    0.302246994e-5,
+    0.203886313e-7,
+    0.638780966e-10,
+)
+
+
+def _p_max_flatau_pa(T):
+    """Saturation vapor pressure over water in Pa (Flatau polynomial, Horner form).
+
+    Accepts a float or an ndarray; only meaningful for -50..+50 °C.
+    """
+    p = _FLATAU6[-1]
+    for a in _FLATAU6[-2::-1]:
+        p = p * T + a
+    return 100.0 * p
+
+
+# Flatau curve pre-sampled on a uniform grid; linear interpolation between
+# 0.1 °C nodes stays within ~2e-5 relative of the polynomial.
+_PMAX_TMIN = -50.0
+_PMAX_DT = 0.1
+_PMAX_INVDT = 1.0 / _PMAX_DT
+_PMAX_T = _PMAX_TMIN + _PMAX_DT * np.arange(1001)  # -50.0 .. +50.0 °C
+_PMAX_TABLE = _p_max_flatau_pa(_PMAX_T)
+# Plain floats for the scalar path (indexing an ndarray boxes each element)
+_PMAX_TABLE_LIST = _PMAX_TABLE.tolist()
+_PMAX_LAST = len(_PMAX_TABLE_LIST) - 1
+
+
+def _p_max_grid_pa(T: float) -> float:
+    """Analytical p_max(T) in Pa from the pre-sampled grid (-50..+50 °C).
+
+    Temperatures outside the grid are evaluated with :func:`_p_max_magnus_pa`.
+    """
+    x = (T - _PMAX_TMIN) * _PMAX_INVDT
+    if not 0.0 <= x < _PMAX_LAST:
+        return _p_max_magnus_pa(T)
+    i = int(x)
+    f = x - i
+    p0 = _PMAX_TABLE_LIST[i]
+    return p0 + f * (_PMAX_TABLE_LIST[i + 1] - p0)
+
+
+def _p_max_grid_vec(T: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`_p_max_grid_pa` over a float64 array."""
+    x = (T - _PMAX_TMIN) * _PMAX_INVDT
+    on_grid = (x >= 0.0) & (x < _PMAX_LAST)
+    i = np.where(on_grid, x, 0.0).astype(np.intp)
+    f = x - i
+    p0 = _PMAX_TABLE[i]
+    out = p0 + f * (_PMAX_TABLE[i + 1] - p0)
+    if not on_grid.all():
+        off = ~on_grid
+        out[off] = _p_max_magnus_vec(T[off])
+    return out
 
 
 def p_max(T: float) -> float:
     """Saturation vapor pressure p_max(T) in Pa.
 
     If table-based interpolation is available, it should be used (Tab. 2.2).
-    Fallback to Magnus approximation when table data is unavailable.
+    Fallback to the pre-sampled Flatau curve (Magnus outside -50..+50 °C)
+    when table data is unavailable.
+    Results are memoized per temperature.
     """
-    # Prefer table interpolation if available and returns a value
-    if _HAS_TABLES and callable(cast(object, p_max_tabulated)):
+    return _p_max_cached(float(T))
+
+
+@lru_cache(maxsize=8192)
+def _p_max_cached(T: float) -> float:
+    val = _warm_p_max.get(T)
+    if val is None:
+        val = _p_max_lookup(T)
+        if _WARM_PATH is not None and len(_warm_p_max) < _WARM_MAX:
+            _warm_p_max[T] = val
+    return val
+
+
+def _p_max_table_or_grid(T: float) -> float:
+    # Prefer table interpolation; fall back when it yields no value
+    try:
+        val = cast(object, p_max_tabulated)(T)
+    except Exception:
+        val = None
+    return _p_max_grid_pa(T) if val is None else float(val)
+
+
+@lru_cache(maxsize=8192)
+def _theta_s_cached(theta: float, phi: float) -> float:
+    """θs for air at θ/φ: Tab. 2.1 when available, otherwise the dew point."""
+    val = _warm_theta_s.get((theta, phi))
+    if val is None:
+        val = _theta_s_lookup(theta, phi)
+        if _WARM_PATH is not None and len(_warm_theta_s) < _WARM_MAX:
+            _warm_theta_s[(theta, phi)] = val
+    return val
+
+
+def _theta_s_array(theta: np.ndarray, phi: np.ndarray) -> np.ndarray:
+    """:func:`_theta_s_cached` over 1-D float64 arrays of θ and φ."""
+    if _theta_s_lookup is not dew_point:
         try:
-            val = cast(object, p_max_tabulated)(T)
-            if val is not None:
-                return float(val)
+            val = cast(object, theta_s_tabulated_vec)(theta, phi)
         except Exception:
-            pass
-    return _p_max_magnus_pa(T)
+            val = None
+        if val is not None and not np.isnan(val).any():
+            return val
+    return np.array([_theta_s_cached(t, p) for t, p in zip(theta.tolist(), phi.tolist())])
+
+
+def _theta_s_table_or_dew(theta: float, phi: float) -> float:
+    try:
+        val = cast(object, theta_s_tabulated)(theta, phi)
+    except Exception:
+        val = None
+    return dew_point(theta, phi) if val is None else float(val)
+
+
+def _resolve_lookups() -> None:
+    """Bind ``_p_max_lookup``/``_theta_s_lookup`` to the table-backed or the
+    analytical implementation once, instead of re-checking on every call."""
+    global _p_max_lookup, _theta_s_lookup
+    if _HAS_TABLES and callable(p_max_tabulated):
+        _p_max_lookup = _p_max_table_or_grid
+    else:
+        _p_max_lookup = _p_max_grid_pa
+    if _HAS_TABLES and callable(theta_s_tabulated):
+        _theta_s_lookup = _theta_s_table_or_dew
+    else:
+        _theta_s_lookup = dew_point
+
+
+# Optional warm cache of the table lookups above, persisted across processes.
+# Enabled by pointing TECCONDENSE_CACHE_DIR at a writable directory; entries
+# are discarded when the context tables change.
+_WARM_ENV = "TECCONDENSE_CACHE_DIR"
+_WARM_MAX = 8192
+_WARM_PATH: Optional[Path] = (
+    Path(os.environ[_WARM_ENV]).expanduser() / "table_lookups.json"
+    if os.environ.get(_WARM_ENV)
+    else None
+)
+_CONTEXT_DIR = Path(__file__).resolve().parents[1] / "context"
+# Bump when the meaning or layout of the cached values changes
+_WARM_VERSION = 1
+_warm_p_max: Dict[float, float] = {}
+_warm_theta_s: Dict[Tuple[float, float], float] = {}
+
+
+def _tables_stamp() -> List[object]:
+    """Identify the cache format, the lookup backends (table or analytical
+    fallback) and the table sources the cached values were derived from."""
+    stamp: List[object] = [
+        _WARM_VERSION,
+        _HAS_TABLES,
+        _p_max_lookup.__name__,
+        _theta_s_lookup.__name__,
+    ]
+    for path in sorted(_CONTEXT_DIR.glob("t2-*")):
+        st = path.stat()
+        stamp.append([path.name, st.st_mtime_ns, st.st_size])
+    return stamp
+
+
+def _load_warm_cache() -> None:
+    if _WARM_PATH is None:
+        return
+    try:
+        data = json.loads(_WARM_PATH.read_text(encoding="utf-8"))
+        if data.get("stamp") != _tables_stamp():
+            return
+        _warm_p_max.update((T, v) for T, v in data.get("p_max", []))
+        _warm_theta_s.update(((t, p), v) for t, p, v in data.get("theta_s", []))
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def _save_warm_cache() -> None:
+    if _WARM_PATH is None or not (_warm_p_max or _warm_theta_s):
+        return
+    data = {
+        "stamp": _tables_stamp(),
+        "p_max": [[T, v] for T, v in _warm_p_max.items()],
+        "theta_s": [[t, p, v] for (t, p), v in _warm_theta_s.items()],
+    }
+    try:
+        _WARM_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _WARM_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, _WARM_PATH)
+    except OSError:
+        pass
 
 
+@lru_cache(maxsize=4096)
 def dew_point(theta: float, phi: float) -> float:
     """Dew point temperature (°C) from air temperature θ (°C) and RH φ (%).
 
     Fallback to inverse Magnus. If Tab. 2.1 (θs) is available, a lookup-based
     implementation should replace this for surface-risk checks.
+    Results are memoized per (θ, φ).
     """
     if phi <= 0:
         return -273.15
@@ -134,6 +409,12 @@ def dew_point(theta: float, phi: float) -> float:
     return td
 
 
+_resolve_lookups()
+_load_warm_cache()
+if _WARM_PATH is not None:
+    atexit.register(_save_warm_cache)
+
+
 def partial_pressures(climate: Climate) -> Tuple[float, float]:
     """Return (p_i, p_e) partial vapor pressures in Pa at interior and exterior air."""
     p_i = climate.phi_i / 100.0 * p_max(climate.theta_i)
@@ -141,23 +422,59 @@ def partial_pressures(climate: Climate) -> Tuple[float, float]:
     return p_i, p_e
 
 
-def vapor_pressure_profile(assembly: Assembly, climate: Climate) -> Tuple[List[float], List[float]]:
-    """Linear p(z) profile along z from p_i to p_e per (2.3). p in Pa, z in m²·Pa·h/kg."""
+def vapor_pressure_profile(
+    assembly: Assembly,
+    climate: Climate,
+    *,
+    p_i_pa: Optional[float] = None,
+    p_e_pa: Optional[float] = None,
+) -> Tuple[List[float], List[float]]:
+    """Linear p(z) profile along z from p_i to p_e per (2.3). p in Pa, z in m²·Pa·h/kg.
+
+    ``p_i_pa``/``p_e_pa`` may be passed when the partial pressures are
+    already known; missing ones are derived from ``climate``.
+    """
+    if p_i_pa is None and p_e_pa is None:
+        core = _compute_core(assembly, climate)
+        return core.z_axis.tolist(), core.p_lin.tolist()
+    if p_i_pa is None or p_e_pa is None:
+        p_i, p_e = partial_pressures(climate)
+        p_i_pa = p_i if p_i_pa is None else p_i_pa
+        p_e_pa = p_e if p_e_pa is None else p_e_pa
     z_axis = z_profile(assembly)
-    if not z_axis:
-        return [], []
-    p_i, p_e = partial_pressures(climate)
+    return z_axis, _vapor_pressure_line(z_axis, p_i_pa, p_e_pa).tolist()
+
+
+def _vapor_pressure_line(z_axis, p_i: float, p_e: float) -> np.ndarray:
+    """Linear p(z) through ``z_axis`` for already known boundary pressures."""
+    z_axis = np.asarray(z_axis, dtype=np.float64)
     z_total = z_axis[-1]
     if z_total == 0:
-        return z_axis, [p_i for _ in z_axis]
+        return np.full(len(z_axis), p_i)
     g0 = (p_i - p_e) / z_total  # kg/(m²·h)
-    p_line = [p_i - g0 * z for z in z_axis]
-    return z_axis, p_line
+    return p_i - g0 * z_axis
 
 
 def saturation_pressure_profile(temps: List[float]) -> List[float]:
-    """Return p_sat(T) in Pa for each temperature in temps."""
-    return [p_max(T) for T in temps]
+    """Return p_sat(T) in Pa for each temperature in temps.
+
+    The whole profile is interpolated in one vectorized pass, on Tab. 2.2
+    when available and otherwise on the pre-sampled grid.
+    """
+    return _p_max_array(np.asarray(temps, dtype=np.float64)).tolist()
+
+
+def _p_max_array(T: np.ndarray) -> np.ndarray:
+    """:func:`p_max` over an array of any shape."""
+    T = np.asarray(T, dtype=np.float64)
+    if _p_max_lookup is not _p_max_grid_pa:
+        try:
+            val = cast(object, p_max_tabulated_vec)(T.ravel())
+        except Exception:
+            val = None
+        if val is not None:
+            return val.reshape(T.shape)
+    return _p_max_grid_vec(T.ravel()).reshape(T.shape)
 
 
 def condensation_zones(p_line: List[float], p_sat_line: List[float], z_axis: List[float]):
@@ -165,54 +482,57 @@ def condensation_zones(p_line: List[float], p_sat_line: List[float], z_axis: Lis
 
     Returns list of dicts: {start_z, end_z, max_excess_pa} where z can be Σ(μ·d) or thickness.
     """
-    zones = []
-    in_zone = False
-    start_z: Optional[float] = None
-    max_excess = 0.0
     n = min(len(p_line), len(p_sat_line), len(z_axis))
     if n == 0:
-        return zones
-
-    def interp_z(i0: int, i1: int) -> float:
-        # Linear interpolation z* where p_line - p_sat crosses zero between i0 and i1
-        x0, x1 = z_axis[i0], z_axis[i1]
-        y0 = p_line[i0] - p_sat_line[i0]
-        y1 = p_line[i1] - p_sat_line[i1]
-        if y1 == y0:
-            return x0
-        t = -y0 / (y1 - y0)
-        return x0 + t * (x1 - x0)
-
-    prev_excess = p_line[0] - p_sat_line[0]
-    for i in range(1, n):
-        excess = p_line[i] - p_sat_line[i]
-        # Track max within current zone
-        if in_zone:
-            max_excess = max(max_excess, excess)
-
-        # Check for crossing
-        if prev_excess <= 0 < excess and not in_zone:
-            # Entering zone: interpolate start
-            start_z = interp_z(i - 1, i)
-            in_zone = True
-            max_excess = excess
-        elif prev_excess > 0 and excess <= 0 and in_zone:
-            # Exiting zone: interpolate end
-            end_z = interp_z(i - 1, i)
-            zones.append({"start_z": start_z, "end_z": end_z, "max_excess_pa": max(0.0, max_excess)})
-            in_zone = False
-            start_z = None
-            max_excess = 0.0
-        prev_excess = excess
-
-    # If still in zone at end, close at the last coordinate
-    if in_zone and start_z is not None:
-        zones.append({"start_z": start_z, "end_z": z_axis[n - 1], "max_excess_pa": max(0.0, max_excess)})
-    return zones
+        return []
+    z = np.asarray(z_axis[:n], dtype=np.float64)
+    e = np.asarray(p_line[:n], dtype=np.float64) - np.asarray(p_sat_line[:n], dtype=np.float64)
+    e0, e1 = e[:-1], e[1:]
+    enter = (e0 <= 0) & (e1 > 0)
+    leave = (e0 > 0) & (e1 <= 0)
+    seg = np.flatnonzero(enter | leave)
+    # Enter/leave events must alternate starting with an enter; drop repeats
+    # (only possible with NaN excess) and a leading leave (wet at z=0)
+    is_enter = enter[seg]
+    keep = is_enter != np.concatenate(([False], is_enter[:-1]))
+    seg, is_enter = seg[keep], is_enter[keep]
+    if not len(seg):
+        return []
+
+    # Linear interpolation z* where p_line - p_sat crosses zero in each segment
+    y0, y1 = e[seg], e[seg + 1]
+    flat = y1 == y0
+    t = np.where(flat, 0.0, -y0 / np.where(flat, 1.0, y1 - y0))
+    zc = z[seg] + t * (z[seg + 1] - z[seg])
+
+    starts = zc[is_enter].tolist()
+    ends = zc[~is_enter].tolist()
+    end_idx = seg[~is_enter] + 1
+    if len(ends) < len(starts):
+        # Still in zone at the end: close at the last coordinate
+        ends.append(z_axis[n - 1])
+        end_idx = np.append(end_idx, n)
+    # Max excess from the entering sample to the leaving one (inclusive);
+    # fmax skips NaN like the scalar max() comparison did
+    bounds = np.column_stack((seg[is_enter] + 1, end_idx + 1)).ravel()
+    e_pad = np.append(e, -np.inf)
+    max_excess = np.fmax.reduceat(e_pad, np.minimum(bounds, n))[::2].tolist()
+    return [
+        {"start_z": s, "end_z": t_, "max_excess_pa": max(0.0, m)}
+        for s, t_, m in zip(starts, ends, max_excess)
+    ]
 
 
 def condensate_amount(
-    assembly: Assembly, climate: Climate, tk_hours: float
+    assembly: Assembly,
+    climate: Climate,
+    tk_hours: float,
+    *,
+    z_axis: Optional[List[float]] = None,
+    temps: Optional[List[float]] = None,
+    p_lin: Optional[List[float]] = None,
+    p_sat: Optional[List[float]] = None,
+    zones: Optional[List[Dict[str, float]] | np.ndarray] = None,
 ) -> Dict[str, object]:
     """Compute condensate mass ``Wk`` over period ``tk``.
 
@@ -230,6 +550,12 @@ def condensate_amount(
         Indoor/outdoor design conditions for the condensation period.
     tk_hours:
         Duration of the condensation period ``tk`` in hours.
+    z_axis, temps, p_lin, p_sat:
+        Optional precomputed profiles, forwarded to :func:`glaser_profile`.
+    zones:
+        Optional zones from a previous :func:`glaser_profile` call (list of
+        dicts or a ``(K, 4)`` array); when given the Glaser construction is
+        not repeated.
 
     Returns
     -------
@@ -238,149 +564,303 @@ def condensate_amount(
         "delta_x_percent"}]}``
     """
 
-    gp = glaser_profile(assembly, climate)
-    zones = gp.get("zones", [])
-    z_axis = z_profile(assembly)
+    if z_axis is None:
+        z_axis = z_profile(assembly)
+    if zones is None:
+        zones_arr = _glaser(
+            assembly, climate, z_axis=z_axis, temps=temps, p_lin=p_lin, p_sat=p_sat
+        )[0]
+    else:
+        zones_arr = _zones_array(zones)
 
-    per_layer_wk = [0.0 for _ in assembly.layers]
-    Wk_total = 0.0
-    for z in zones:
-        dz_zone = max(0.0, z["end_z"] - z["start_z"])
-        if dz_zone <= 0:
-            continue
-        g_before = z.get("g_before", 0.0)
-        g_after = z.get("g_after", 0.0)
-        Wk_rate = max(0.0, g_before - g_after)  # kg/(m²·h)
-        Wk_total += Wk_rate * tk_hours
-        for i in range(len(assembly.layers)):
-            z0, z1 = z_axis[i], z_axis[i + 1]
-            overlap = max(0.0, min(z1, z["end_z"]) - max(z0, z["start_z"]))
-            if overlap > 0 and dz_zone > 0:
-                per_layer_wk[i] += Wk_rate * tk_hours * (overlap / dz_zone)
-
-    layers_out: List[Dict[str, float]] = []
-    for i, layer in enumerate(assembly.layers):
-        Wk_layer = per_layer_wk[i]
-        dz_phys = max(layer.d, 1e-9)
-        rho = max(layer.rho, 1e-9)
-        delta_x_percent = Wk_layer / (dz_phys * rho) * 100.0
-        layers_out.append({
-            "index": float(i),
-            "Wk_layer": Wk_layer,
-            "delta_x_percent": delta_x_percent,
-        })
-
-    return {"Wk_total": Wk_total, "layers": layers_out}
-
-
-def glaser_profile(assembly: Assembly, climate: Climate) -> Dict[str, object]:
-    """Construct Glaser-style condensation-limited p(z) with zones and slopes.
+    return _condensate_dict(_condensate(assembly, z_axis, zones_arr, tk_hours))
 
-    Returns dict keys: z_axis, p_sat, p_linear, z_final, p_final, zones[{start_z,end_z,g_before,g_after}]
+
+class _Condensate(NamedTuple):
+    """Condensate per layer (SoA) before conversion to the public dicts."""
+
+    Wk_total: float
+    wk_layer: np.ndarray  # kg/m² per layer
+    delta_x: np.ndarray  # Δx_dif [%] per layer
+
+
+def _condensate(assembly: Assembly, z_axis, zones: np.ndarray, tk_hours: float) -> _Condensate:
+    arrs = assembly._arrays()
+    if not len(zones):
+        # Dry assembly: nothing to apportion
+        Wk_total, per_layer_wk = 0.0, np.zeros(len(arrs.d))
+    else:
+        Wk_total, per_layer_wk = _condensate_split(
+            np.asarray(z_axis, dtype=np.float64), len(arrs.d), zones, tk_hours
+        )
+    delta_x = per_layer_wk / (np.maximum(arrs.d, 1e-9) * np.maximum(arrs.rho, 1e-9)) * 100.0
+    return _Condensate(Wk_total, per_layer_wk, delta_x)
+
+
+def _condensate_dict(wk: _Condensate) -> Dict[str, object]:
+    layers_out: List[Dict[str, float]] = [
+        {"index": float(i), "Wk_layer": wk_i, "delta_x_percent": dx_i}
+        for i, (wk_i, dx_i) in enumerate(zip(wk.wk_layer.tolist(), wk.delta_x.tolist()))
+    ]
+    return {"Wk_total": wk.Wk_total, "layers": layers_out}
+
+
+def _condensate_split(
+    z_arr: np.ndarray, n_layers: int, zones: np.ndarray, tk_hours: float
+) -> Tuple[float, np.ndarray]:
+    """Return ``(Wk_total, Wk per layer)`` for ``(K, 4)`` zone rows."""
+    z_lo, z_hi = z_arr[:n_layers], z_arr[1:n_layers + 1]
+    start, end, g_before, g_after = zones.T
+    dz = end - start
+    wet = dz > 0
+    # Condensation rate kg/(m²·h) times tk, for zones of non-zero width
+    wk_zone = np.where(wet, np.maximum(0.0, g_before - g_after), 0.0) * tk_hours
+    Wk_total = float(wk_zone.sum())
+    # Share of each zone falling into each layer [z_lo, z_hi], shape (K, N)
+    overlap = np.clip(
+        np.minimum(z_hi, end[:, None]) - np.maximum(z_lo, start[:, None]), 0.0, None
+    )
+    share = overlap / np.where(wet, dz, 1.0)[:, None]
+    return Wk_total, (wk_zone[:, None] * share).sum(axis=0)
+
+
+@njit(cache=True)
+def _interp_at(zq: np.ndarray, z_arr: np.ndarray, a_arr: np.ndarray) -> np.ndarray:
+    """Piecewise-linear ``a_arr(z)`` at query points ``zq``, clamped to the ends.
+
+    ``z_arr`` must be non-decreasing; each query is bracketed with a binary
+    search (first node with ``z_arr[i] >= zq``).
+    """
+    i = np.minimum(np.maximum(np.searchsorted(z_arr, zq), 1), len(z_arr) - 1)
+    z0, z1 = z_arr[i - 1], z_arr[i]
+    a0, a1 = a_arr[i - 1], a_arr[i]
+    dz = z1 - z0
+    flat = dz == 0
+    t = np.where(flat, 0.0, (zq - z0) / np.where(flat, 1.0, dz))
+    out = a0 + t * (a1 - a0)
+    out = np.where(zq <= z_arr[0], a_arr[0], out)
+    return np.where(zq >= z_arr[-1], a_arr[-1], out)
+
+
+@njit(cache=True)
+def _glaser_core(z: np.ndarray, p_lin: np.ndarray, p_sat: np.ndarray):
+    """Numeric Glaser construction on equal-length float64 arrays.
+
+    Returns ``(zones, z_final, p_final)`` where ``zones`` is a ``(K, 4)``
+    array of ``[start_z, end_z, g_before, g_after]`` rows (``K = 0`` if dry).
+    Compiled with Numba when available, otherwise runs as NumPy code.
     """
-    z_axis, p_lin = vapor_pressure_profile(assembly, climate)
-    temps = temperature_profile(assembly, climate)
-    p_sat = saturation_pressure_profile(temps)
-    if not z_axis:
-        return {"z_axis": [], "p_sat": [], "p_linear": [], "z_final": [], "p_final": [], "zones": []}
-
-    # Differences at interfaces
-    diff = [pl - ps for pl, ps in zip(p_lin, p_sat)]
-    # Find merged condensation intervals [a,b]
-    intervals = []  # type: List[Tuple[float, float]]
-    for i in range(len(z_axis) - 1):
-        z0, z1 = z_axis[i], z_axis[i + 1]
-        d0, d1 = diff[i], diff[i + 1]
-        if d0 > 0 and d1 > 0:
-            if intervals and abs(intervals[-1][1] - z0) < 1e-12:
-                intervals[-1] = (intervals[-1][0], z1)
+    n = z.shape[0]
+    # Differences at interfaces and per-segment wet/dry classification
+    diff = p_lin - p_sat
+    d0, d1 = diff[:-1], diff[1:]
+    inside = (d0 > 0) & (d1 > 0)
+    enter = (d0 <= 0) & (d1 > 0)
+    leave = (d0 > 0) & (d1 <= 0)
+    # Zero crossing of p - p_sat within every segment (used for enter/leave)
+    dd = d1 - d0
+    flat = dd == 0
+    t = np.where(flat, 0.0, -d0 / np.where(flat, 1.0, dd))
+    zc = z[:-1] + t * (z[1:] - z[:-1])
+
+    # Condensation intervals [a,b], at most one per segment; only wet
+    # segments are visited
+    iv = np.empty((max(n - 1, 0), 2))
+    k = 0
+    for i in np.flatnonzero(inside | enter | leave):
+        if inside[i]:
+            if k > 0 and abs(iv[k - 1, 1] - z[i]) < 1e-12:
+                iv[k - 1, 1] = z[i + 1]
             else:
-                intervals.append((z0, z1))
-        elif d0 <= 0 < d1:
+                iv[k, 0] = z[i]
+                iv[k, 1] = z[i + 1]
+                k += 1
+        elif enter[i]:
             # enter zone between z0..z1
-            t = 0.0 if (d1 - d0) == 0 else (-d0) / (d1 - d0)
-            za = z0 + t * (z1 - z0)
-            intervals.append((za, z1))
-        elif d0 > 0 >= d1:
+            iv[k, 0] = zc[i]
+            iv[k, 1] = z[i + 1]
+            k += 1
+        elif k > 0:
             # leave zone
-            t = 0.0 if (d1 - d0) == 0 else (-d0) / (d1 - d0)
-            zb = z0 + t * (z1 - z0)
-            if intervals:
-                a, _ = intervals[-1]
-                intervals[-1] = (a, zb)
-            else:
-                intervals.append((z0, zb))
+            iv[k - 1, 1] = zc[i]
+        else:
+            iv[k, 0] = z[i]
+            iv[k, 1] = zc[i]
+            k += 1
 
     # Merge overlaps
-    merged: List[Tuple[float, float]] = []
-    for a, b in intervals:
+    merged = np.empty((k, 2))
+    m = 0
+    for j in range(k):
+        a, b = iv[j, 0], iv[j, 1]
         if a > b:
             a, b = b, a
-        if not merged:
-            merged.append((a, b))
+        if m > 0 and a <= merged[m - 1, 1] + 1e-12:
+            merged[m - 1, 1] = max(merged[m - 1, 1], b)
         else:
-            pa, pb = merged[-1]
-            if a <= pb + 1e-12:
-                merged[-1] = (pa, max(pb, b))
-            else:
-                merged.append((a, b))
-
-    if not merged:
-        return {"z_axis": z_axis, "p_sat": p_sat, "p_linear": p_lin, "z_final": z_axis, "p_final": p_lin, "zones": []}
-
-    def interp(zq: float, zs: List[float], arr: List[float]) -> float:
-        if zq <= zs[0]:
-            return arr[0]
-        if zq >= zs[-1]:
-            return arr[-1]
-        for i in range(1, len(zs)):
-            if zq <= zs[i]:
-                z0, z1 = zs[i - 1], zs[i]
-                a0, a1 = arr[i - 1], arr[i]
-                t = 0.0 if (z1 - z0) == 0 else (zq - z0) / (z1 - z0)
-                return a0 + t * (a1 - a0)
-        return arr[-1]
-
-    zones_out: List[Dict[str, float]] = []
-    z_final: List[float] = [z_axis[0]]
-    p_final: List[float] = [p_lin[0]]
+            merged[m, 0] = a
+            merged[m, 1] = b
+            m += 1
+
+    zones = np.zeros((m, 4))
+    if m == 0:
+        return zones, z.copy(), p_lin.copy()
+
+    # p_sat at every zone boundary, looked up in one vectorized pass
+    p_ab = _interp_at(merged[:m].ravel(), z, p_sat)
+
+    z_final = np.empty(m + 2)
+    p_final = np.empty(m + 2)
+    z_final[0] = z[0]
+    p_final[0] = p_lin[0]
+    c = 1
 
     # Compute slopes and assemble piecewise
     # Leftmost to first a
-    a0, b0 = merged[0]
-    p_a0 = interp(a0, z_axis, p_sat)
+    a0, b0 = merged[0, 0], merged[0, 1]
+    p_a0, p_last_b = p_ab[0], p_ab[1]
     g_left = (p_final[0] - p_a0) / max(a0 - z_final[0], 1e-12)
     if a0 > z_final[0] + 1e-12:
-        z_final.append(a0)
-        p_final.append(p_a0)
+        z_final[c] = a0
+        p_final[c] = p_a0
+        c += 1
     last_b = b0
-    p_last_b = interp(b0, z_axis, p_sat)
-    zones_out.append({"start_z": a0, "end_z": b0, "g_before": g_left, "g_after": 0.0})
+    zones[0, 0], zones[0, 1], zones[0, 2] = a0, b0, g_left
 
     # Middle segments
-    for k in range(1, len(merged)):
-        a, b = merged[k]
-        p_a = interp(a, z_axis, p_sat)
+    for j in range(1, m):
+        a, b = merged[j, 0], merged[j, 1]
+        p_a, p_b = p_ab[2 * j], p_ab[2 * j + 1]
         # linear segment from last_b to a
         g_mid = (p_last_b - p_a) / max(a - last_b, 1e-12)
-        z_final.append(a)
-        p_final.append(p_a)
-        zones_out[-1]["g_after"] = g_mid
+        z_final[c] = a
+        p_final[c] = p_a
+        c += 1
+        zones[j - 1, 3] = g_mid
         # zone [a,b]
-        p_b = interp(b, z_axis, p_sat)
-        zones_out.append({"start_z": a, "end_z": b, "g_before": g_mid, "g_after": 0.0})
+        zones[j, 0], zones[j, 1], zones[j, 2] = a, b, g_mid
         last_b, p_last_b = b, p_b
 
     # Rightmost from last_b to z_total to meet p_e
-    z_total = z_axis[-1]
-    p_e = p_lin[-1]
+    z_total = z[n - 1]
+    p_e = p_lin[n - 1]
     g_right = (p_last_b - p_e) / max(z_total - last_b, 1e-12)
-    zones_out[-1]["g_after"] = g_right
-    if z_final[-1] < z_total - 1e-12:
-        z_final.append(z_total)
-        p_final.append(p_e)
+    zones[m - 1, 3] = g_right
+    if z_final[c - 1] < z_total - 1e-12:
+        z_final[c] = z_total
+        p_final[c] = p_e
+        c += 1
+    return zones, z_final[:c], p_final[:c]
+
+
+# Kernels with fixed signatures for ahead-of-time compilation (build_aot.py).
+# When the prebuilt extension is importable it replaces the JIT versions, so
+# the first call does not pay Numba's compile time.
+_AOT_EXPORTS = {
+    "p_max_magnus": (_p_max_magnus_pa, "f8(f8)"),
+    "p_max_magnus_vec": (_p_max_magnus_vec, "f8[:](f8[:])"),
+    "glaser_core": (_glaser_core, "Tuple((f8[:,:], f8[:], f8[:]))(f8[:], f8[:], f8[:])"),
+}
+
+try:  # pragma: no cover - only present after running build_aot.py
+    from . import condensation_kernels as _aot  # type: ignore
+except ImportError:
+    _aot = None
+else:  # pragma: no cover
+    _p_max_magnus_pa = _aot.p_max_magnus
+    _p_max_magnus_vec = _aot.p_max_magnus_vec
+    _glaser_core = _aot.glaser_core
+
+
+def _zones_array(zones) -> np.ndarray:
+    """Return ``zones`` as a ``(K, 4)`` float64 array of zone rows."""
+    if isinstance(zones, np.ndarray):
+        return zones.reshape(-1, 4)
+    return np.array(
+        [
+            (z["start_z"], z["end_z"], z.get("g_before", 0.0), z.get("g_after", 0.0))
+            for z in zones
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 4)
+
+
+def _zones_dicts(zones: np.ndarray) -> List[Dict[str, float]]:
+    """Convert a ``(K, 4)`` zone array to the public list-of-dicts form."""
+    return [
+        {"start_z": a, "end_z": b, "g_before": gb, "g_after": ga}
+        for a, b, gb, ga in zones.tolist()
+    ]
+
+
+def _glaser(
+    assembly: Assembly,
+    climate: Climate,
+    *,
+    z_axis: Optional[List[float]] = None,
+    temps: Optional[List[float]] = None,
+    p_lin: Optional[List[float]] = None,
+    p_sat: Optional[List[float]] = None,
+):
+    """Array form of :func:`glaser_profile`.
+
+    Returns ``(zones, z_final, p_final, z_axis, p_lin, p_sat)``; ``zones`` is
+    a ``(K, 4)`` array of ``[start_z, end_z, g_before, g_after]`` rows and
+    ``z_final``/``p_final`` are arrays (the linear profile when dry). The
+    input profiles may be lists or arrays and are returned as given.
+    """
+    if z_axis is None:
+        z_axis = _compute_core(assembly, climate).z_axis
+    if p_lin is None:
+        core = _compute_core(assembly, climate)
+        p_lin = _vapor_pressure_line(z_axis, core.p_i, core.p_e) if len(z_axis) else []
+    if p_sat is None:
+        if temps is None:
+            p_sat = _compute_core(assembly, climate).p_sat
+        else:
+            p_sat = saturation_pressure_profile(temps)
+    if not len(z_axis):
+        empty = np.zeros(0)
+        return np.zeros((0, 4)), empty, empty, z_axis, p_lin, p_sat
+
+    n = min(len(z_axis), len(p_lin), len(p_sat))
+    p_lin_arr = np.asarray(p_lin[:n], dtype=np.float64)
+    p_sat_arr = np.asarray(p_sat[:n], dtype=np.float64)
+    # Fast path for the common dry case: p never exceeds p_sat, so there are
+    # no zones and the linear profile is final
+    if not (p_lin_arr > p_sat_arr).any():
+        z_fin, p_fin = np.asarray(z_axis, dtype=np.float64), np.asarray(p_lin, dtype=np.float64)
+        return np.zeros((0, 4)), z_fin, p_fin, z_axis, p_lin, p_sat
+    zones, z_fin, p_fin = _glaser_core(
+        np.asarray(z_axis[:n], dtype=np.float64), p_lin_arr, p_sat_arr
+    )
+    if not len(zones):
+        z_fin, p_fin = np.asarray(z_axis, dtype=np.float64), np.asarray(p_lin, dtype=np.float64)
+    return zones, z_fin, p_fin, z_axis, p_lin, p_sat
 
-    return {"z_axis": z_axis, "p_sat": p_sat, "p_linear": p_lin, "z_final": z_final, "p_final": p_final, "zones": zones_out}
+
+def glaser_profile(
+    assembly: Assembly,
+    climate: Climate,
+    *,
+    z_axis: Optional[List[float]] = None,
+    temps: Optional[List[float]] = None,
+    p_lin: Optional[List[float]] = None,
+    p_sat: Optional[List[float]] = None,
+) -> Dict[str, object]:
+    """Construct Glaser-style condensation-limited p(z) with zones and slopes.
+
+    Profiles already computed by the caller may be passed as keyword
+    arguments; missing ones are derived from ``assembly``/``climate``.
+    The numeric work is done by :func:`_glaser_core`.
+
+    Returns dict keys: z_axis, p_sat, p_linear, z_final, p_final, zones[{start_z,end_z,g_before,g_after}]
+    """
+    zones, z_fin, p_fin, z_axis, p_lin, p_sat = _glaser(
+        assembly, climate, z_axis=z_axis, temps=temps, p_lin=p_lin, p_sat=p_sat
+    )
+    z_axis, p_lin, p_sat = (np.asarray(a, dtype=np.float64).tolist() for a in (z_axis, p_lin, p_sat))
+    return {"z_axis": z_axis, "p_sat": p_sat, "p_linear": p_lin, "z_final": z_fin.tolist(), "p_final": p_fin.tolist(), "zones": _zones_dicts(zones)}
 
 
 def drying_check(
@@ -413,17 +893,27 @@ def moisture_limits_check(assembly: Assembly, wk_layers: List[Dict[str, float]])
     wk_layers: list of dicts with keys index, delta_x_percent from condensate_amount.
     Returns list of {index, x_uk_prime, x_max, ok}.
     """
-    out: List[Dict[str, float | bool]] = []
-    for i, layer in enumerate(assembly.layers):
-        dx = 0.0
-        for row in wk_layers:
-            if int(row.get("index", -1)) == i:
-                dx = float(row.get("delta_x_percent", 0.0))
-                break
-        x_uk = layer.xr_percent + dx
-        ok = x_uk < layer.xmax_percent
-        out.append({"index": float(i), "x_uk_prime": x_uk, "x_max": layer.xmax_percent, "ok": ok})
-    return out
+    arrs = assembly._arrays()
+    n = len(arrs.d)
+    dx = np.zeros(n)
+    seen = [False] * n
+    for row in wk_layers:
+        i = int(row.get("index", -1))
+        if 0 <= i < n and not seen[i]:  # first row per layer wins
+            dx[i] = float(row.get("delta_x_percent", 0.0))
+            seen[i] = True
+    return _moisture_limits(assembly, dx)
+
+
+def _moisture_limits(assembly: Assembly, delta_x: np.ndarray) -> List[Dict[str, float | bool]]:
+    """:func:`moisture_limits_check` for a per-layer Δx_dif array."""
+    arrs = assembly._arrays()
+    x_uk = arrs.xr_percent + delta_x
+    ok = x_uk < arrs.xmax_percent
+    return [
+        {"index": float(i), "x_uk_prime": x, "x_max": xm, "ok": k}
+        for i, (x, xm, k) in enumerate(zip(x_uk.tolist(), arrs.xmax_percent.tolist(), ok.tolist()))
+    ]
 
 
 def surface_condensation_risk(assembly: Assembly, climate: Climate) -> Dict[str, float | bool]:
@@ -439,25 +929,11 @@ def surface_condensation_risk(assembly: Assembly, climate: Climate) -> Dict[str,
     q = U * (climate.theta_i - climate.theta_e)
     theta_si = climate.theta_i - q * assembly.Rsi
     # Prefer tabulated θs if available; fallback to dew point
-    theta_s = None
-    if _HAS_TABLES and callable(cast(object, theta_s_tabulated)):
-        try:
-            theta_s = cast(object, theta_s_tabulated)(climate.theta_i, climate.phi_i)
-        except Exception:
-            theta_s = None
-    if theta_s is None:
-        theta_s = dew_point(climate.theta_i, climate.phi_i)
+    theta_s = _theta_s_cached(climate.theta_i, climate.phi_i)
     risk = theta_si < theta_s
     # External surface check
-    theta_se = temperature_profile(assembly, climate)[-1]
-    theta_s_e = None
-    if _HAS_TABLES and callable(cast(object, theta_s_tabulated)):
-        try:
-            theta_s_e = cast(object, theta_s_tabulated)(climate.theta_e, climate.phi_e)
-        except Exception:
-            theta_s_e = None
-    if theta_s_e is None:
-        theta_s_e = dew_point(climate.theta_e, climate.phi_e)
+    theta_se = _theta_se(assembly, climate, q)
+    theta_s_e = _theta_s_cached(climate.theta_e, climate.phi_e)
     risk_e = theta_se < theta_s_e
     return {"theta_si": theta_si, "theta_s": theta_s, "risk": risk, "theta_se": theta_se, "theta_s_e": theta_s_e, "risk_e": risk_e}
 
@@ -473,65 +949,232 @@ def analyze(
 
     When ``verbose`` is ``True`` the returned dict additionally contains a
     ``"proof"`` key with human readable step-by-step calculations.
+
+    Results are memoized on the (frozen) inputs; each call returns fresh
+    copies, so callers may modify the result freely.
     """
+    return {k: _fresh(v) for k, v in _analyze(assembly, climate, tk_hours, tu_hours, verbose).items()}
+
+
+def _fresh(value):
+    """Copy of one :func:`analyze` value: lists, dicts and the dicts in lists."""
+    if isinstance(value, list):
+        return [dict(v) if isinstance(v, dict) else v for v in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+@lru_cache(maxsize=256)
+def _analyze(
+    assembly: Assembly,
+    climate: Climate,
+    tk_hours: float,
+    tu_hours: float,
+    verbose: bool,
+) -> Dict[str, object]:
+    plan = _assembly_plan(assembly)
+    prof = _compute_core(assembly, climate)
+    return _analyze_plan(plan, prof, assembly, climate, tk_hours, tu_hours, verbose)
+
+
+def _analyze_plan(
+    plan: _Plan,
+    prof: _Core,
+    assembly: Assembly,
+    climate: Climate,
+    tk_hours: float,
+    tu_hours: float,
+    verbose: bool,
+) -> Dict[str, object]:
+    """Uncached body of :func:`_analyze` on precomputed plan and profiles."""
     steps: List[str] = []
 
-    U, R_total = u_value(assembly)
+    U, R_total, q = prof.U, prof.R_total, prof.q
     if verbose:
-        R_layers = sum(layer.d / layer.lambda_ for layer in assembly.layers)
+        R_layers = assembly._R_layers
         steps.append(
             f"R_total = Rsi + Σ(d/λ) + Rse = {assembly.Rsi:.3f} + {R_layers:.3f} + {assembly.Rse:.3f} = {R_total:.3f} m²K/W"
         )
         steps.append(f"U = 1 / R_total = 1 / {R_total:.3f} = {U:.4f} W/m²K")
 
-    temps = temperature_profile(assembly, climate)
-    z_axis, p_line = vapor_pressure_profile(assembly, climate)
-    p_sat = saturation_pressure_profile(temps)
-    gp = glaser_profile(assembly, climate)
-    z_final = gp["z_final"]
-    p_final = gp["p_final"]
-    zones = gp["zones"]
-    wk = condensate_amount(assembly, climate, tk_hours)
-    cond_proxy = wk["Wk_total"]
-    drying = drying_capacity(assembly, tu_hours, None)
+    zones_arr, z_final, p_final = _glaser(
+        assembly, climate, z_axis=prof.z_axis, p_lin=prof.p_lin, p_sat=prof.p_sat
+    )[:3]
+    wk = _condensate(assembly, prof.z_axis, zones_arr, tk_hours)
+    wk_out = _condensate_dict(wk)
+    capacity = plan.g_dry * tu_hours
     # Determine if the drying period can remove accumulated condensate
-    drying_ok = drying_check(assembly, climate, tk_hours, tu_hours)
+    # (same comparison as drying_check, reusing the values above)
+    drying_ok = capacity >= wk.Wk_total
     surface = surface_condensation_risk(assembly, climate)
-    p_i, p_e = partial_pressures(climate)
 
-    q = U * (climate.theta_i - climate.theta_e) if math.isfinite(U) else float("nan")
     if verbose:
         steps.append(
             f"q = U * (θi - θe) = {U:.4f} * ({climate.theta_i:.1f} - {climate.theta_e:.1f}) = {q:.3f} W/m²"
         )
 
     result = {
+        "U": U,
+        "R_total": R_total,
+        "q": q,
+        "theta_profile": prof.temps.tolist(),
+        "thickness_axis": prof.thickness.tolist(),
+        "vapor_axis": prof.z_axis.tolist(),
+        "p_line": prof.p_lin.tolist(),
+        "vapor_axis_final": z_final.tolist(),
+        "p_final": p_final.tolist(),
+        "p_sat": prof.p_sat.tolist(),
+        "zones": _zones_dicts(zones_arr),
+        "condensate_proxy": wk.Wk_total,
+        "Wk_total": wk.Wk_total,
+        "Wk_layers": wk_out["layers"],
+        "drying_capacity": capacity,
+        "drying_ok": drying_ok,
+        "moisture_limits": _moisture_limits(assembly, wk.delta_x),
+        "surface": surface,
+        "p_i": prof.p_i,
+        "p_e": prof.p_e,
+    }
+
+    if verbose:
+        result["proof"] = steps
+
+    return result
+
+
+def analyze_batch(
+    assembly: Assembly,
+    climates: Sequence[Climate],
+    tk_hours: float = 1440.0,
+    tu_hours: float = 1440.0,
+) -> Dict[str, object]:
+    """Evaluate one assembly under many climates (e.g. an hourly design year).
+
+    Assembly-dependent quantities (U, resistances, vapour axis, drying
+    capacity) are computed once; the climate-dependent profiles are built as
+    ``(K, N)`` arrays with one row per climate. The Glaser construction only
+    runs for rows where p exceeds p_sat somewhere.
+
+    Returns a dict of scalars and NumPy arrays; keys mirror :func:`analyze`
+    (``theta_profile``, ``p_line``, ``p_sat``, ``Wk_total``, ``Wk_layers``,
+    ``drying_ok``, ...) and the surface check is flattened into ``theta_si``,
+    ``theta_s``, ``risk``, ``theta_se``, ``theta_s_e`` and ``risk_e``.
+    """
+    K = len(climates)
+    theta_i = np.fromiter((c.theta_i for c in climates), dtype=np.float64, count=K)
+    phi_i = np.fromiter((c.phi_i for c in climates), dtype=np.float64, count=K)
+    theta_e = np.fromiter((c.theta_e for c in climates), dtype=np.float64, count=K)
+    phi_e = np.fromiter((c.phi_e for c in climates), dtype=np.float64, count=K)
+
+    U, R_total = u_value(assembly)
+    n_layers = len(assembly.layers)
+    degenerate = not math.isfinite(U) or R_total == 0
+    if degenerate:
+        q = np.full(K, float("nan"))
+        temps = np.repeat(theta_i[:, None], n_layers + 2, axis=1)
+        temps[:, -1] = theta_e
+    else:
+        q = U * (theta_i - theta_e)
+        temps = theta_i[:, None] - q[:, None] * (assembly.Rsi + assembly._R_cum)
+        theta_se = theta_e + q * assembly.Rse
+        if n_layers:
+            temps[:, -1] = theta_se
+        else:
+            temps = np.column_stack((temps[:, 0], theta_se))
+
+    # Partial pressures and the linear p(z) per climate
+    p_i = phi_i / 100.0 * _p_max_array(theta_i)
+    p_e = phi_e / 100.0 * _p_max_array(theta_e)
+    z_arr = np.asarray(_z_profile(assembly), dtype=np.float64)
+    z_total = z_arr[-1]
+    if z_total == 0:
+        p_line = np.repeat(p_i[:, None], len(z_arr), axis=1)
+    else:
+        g0 = (p_i - p_e) / z_total
+        p_line = p_i[:, None] - g0[:, None] * z_arr
+    p_sat = _p_max_array(temps)
+
+    # Glaser construction and condensate only where p > p_sat somewhere
+    n = min(len(z_arr), temps.shape[1])
+    Wk_total = np.zeros(K)
+    Wk_layers = np.zeros((K, n_layers))
+    wet_rows = np.flatnonzero((p_line[:, :n] > p_sat[:, :n]).any(axis=1))
+    has_zones = np.zeros(K, dtype=bool)
+    for k in wet_rows.tolist():
+        zones = _glaser_core(z_arr[:n], p_line[k, :n], p_sat[k, :n])[0]
+        if len(zones):
+            has_zones[k] = True
+            Wk_total[k], Wk_layers[k] = _condensate_split(z_arr, n_layers, zones, tk_hours)
+
+    capacity = drying_capacity(assembly, tu_hours, None)["capacity_kg_m2"]
+
+    # Surface condensation risk (θsi vs θs, θse vs θs at the exterior)
+    if degenerate:
+        theta_s = np.array([dew_point(t, p) for t, p in zip(theta_i.tolist(), phi_i.tolist())])
+        theta_si = theta_i.copy()
+        risk = np.zeros(K, dtype=bool)
+        theta_se = np.full(K, float("nan"))
+        theta_s_e = np.full(K, float("nan"))
+        risk_e = np.zeros(K, dtype=bool)
+    else:
+        theta_s = _theta_s_array(theta_i, phi_i)
+        theta_si = theta_i - q * assembly.Rsi
+        risk = theta_si < theta_s
+        theta_s_e = _theta_s_array(theta_e, phi_e)
+        risk_e = theta_se < theta_s_e
+
+    return {
         "U": U,
         "R_total": R_total,
         "q": q,
         "theta_profile": temps,
         "thickness_axis": thickness_axis(assembly),
-        "vapor_axis": z_axis,
+        "vapor_axis": z_arr,
         "p_line": p_line,
-        "vapor_axis_final": z_final,
-        "p_final": p_final,
         "p_sat": p_sat,
-        "zones": zones,
-        "condensate_proxy": cond_proxy,
-        "Wk_total": wk["Wk_total"],
-        "Wk_layers": wk["layers"],
-        "drying_capacity": drying["capacity_kg_m2"],
-        "drying_ok": drying_ok,
-        "moisture_limits": moisture_limits_check(assembly, wk["layers"]),
-        "surface": surface,
         "p_i": p_i,
         "p_e": p_e,
+        "internal_condensation": has_zones,
+        "Wk_total": Wk_total,
+        "Wk_layers": Wk_layers,
+        "drying_capacity": capacity,
+        "drying_ok": capacity >= Wk_total,
+        "theta_si": theta_si,
+        "theta_s": theta_s,
+        "risk": risk,
+        "theta_se": theta_se,
+        "theta_s_e": theta_s_e,
+        "risk_e": risk_e,
     }
 
-    if verbose:
-        result["proof"] = steps
 
-    return result
+def compile_solver(assembly: Assembly):
+    """Return an :func:`analyze` specialized on ``assembly`` for climate sweeps.
+
+    The assembly-dependent part (U, resistances, vapour and thickness axes,
+    drying flux) is evaluated once here; the returned
+    ``solve(theta_i, phi_i, theta_e, phi_e, tk_hours=1440.0, tu_hours=1440.0,
+    verbose=False)`` only does the climate-dependent work and returns the same
+    dict as :func:`analyze`. It holds on to its own plan and bypasses the
+    :func:`analyze` memo, so results are independent of the shared caches.
+    """
+    plan = _assembly_plan(assembly)
+
+    def solve(
+        theta_i: float,
+        phi_i: float,
+        theta_e: float,
+        phi_e: float,
+        tk_hours: float = 1440.0,
+        tu_hours: float = 1440.0,
+        verbose: bool = False,
+    ) -> Dict[str, object]:
+        climate = Climate(theta_i=theta_i, phi_i=phi_i, theta_e=theta_e, phi_e=phi_e)
+        prof = _core_from_plan(plan, assembly, climate)
+        return _analyze_plan(plan, prof, assembly, climate, tk_hours, tu_hours, verbose)
+
+    return solve
 
 
 def condensation_mass_and_moisture(
@@ -554,7 +1197,7 @@ def drying_capacity(assembly: Assembly, tu_hours: float, drying_climate: Optiona
     Capacity [kg/m²] ≈ |(p_i - p_e)| / Σz * tu.
     """
     if drying_climate is None:
-        drying_climate = Climate(theta_i=18.0, phi_i=65.0, theta_e=18.0, phi_e=65.0)
+        drying_climate = _DRYING_CLIMATE
     p_i, p_e = partial_pressures(drying_climate)
     # Total vapor resistance Σz (m²·Pa·h/kg)
     s_total = z_profile(assembly)[-1] if assembly.layers else 0.0
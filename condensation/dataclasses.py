@@ -1,7 +1,9 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import NamedTuple, Tuple
 
-@dataclass
+import numpy as np
+
+@dataclass(frozen=True, slots=True)
 class Layer:
     name: str
     d: float  # thickness [m]
@@ -11,13 +13,59 @@ class Layer:
     xr_percent: float  # reference moisture [%]
     xmax_percent: float  # max moisture [%]
 
-@dataclass
+class LayerArrays(NamedTuple):
+    """Per-layer properties of an :class:`Assembly` as float64 arrays (SoA)."""
+
+    d: np.ndarray
+    lambda_: np.ndarray
+    mu: np.ndarray
+    rho: np.ndarray
+    xr_percent: np.ndarray
+    xmax_percent: np.ndarray
+    r: np.ndarray  # thermal resistance d/λ per layer [m2K/W]
+
+@dataclass(frozen=True, slots=True)
 class Assembly:
-    layers: List[Layer]
+    """Immutable, hashable layer stack; ``layers`` is stored as a tuple."""
+
+    layers: Tuple[Layer, ...]
     Rsi: float  # internal surface resistance [m2K/W]
     Rse: float  # external surface resistance [m2K/W]
+    _arrays_cache: LayerArrays = field(init=False, repr=False, compare=False)
+    _R_layers: float = field(init=False, repr=False, compare=False)  # Σ(d/λ)
+    _R_cum: np.ndarray = field(init=False, repr=False, compare=False)  # [0, cumsum(d/λ)]
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept any sequence of layers; keep a tuple so the assembly is hashable
+        layers = tuple(self.layers)
+        object.__setattr__(self, "layers", layers)
+        object.__setattr__(self, "_hash", hash((layers, self.Rsi, self.Rse)))
+
+        n = len(layers)
+
+        def col(attr: str) -> np.ndarray:
+            return np.fromiter((getattr(L, attr) for L in layers), dtype=np.float64, count=n)
+
+        d, lam = col("d"), col("lambda_")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = d / lam
+        arrays = LayerArrays(d, lam, col("mu"), col("rho"), col("xr_percent"), col("xmax_percent"), r)
+        R_cum = np.concatenate(([0.0], np.cumsum(r)))
+        for a in (*arrays, R_cum):
+            a.flags.writeable = False
+        object.__setattr__(self, "_arrays_cache", arrays)
+        object.__setattr__(self, "_R_layers", float(r.sum()))
+        object.__setattr__(self, "_R_cum", R_cum)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def _arrays(self) -> LayerArrays:
+        """Return the per-layer :class:`LayerArrays` built at construction."""
+        return self._arrays_cache
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Climate:
     theta_i: float  # indoor temperature [°C]
     phi_i: float    # indoor relative humidity [%]
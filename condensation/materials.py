@@ -2,11 +2,22 @@ from __future__ import annotations
 
 from pathlib import Path
 import csv
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Iterable, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 MATERIALS_CSV = ROOT / 'context' / 'materials.csv'
 
+# Output key, field label used in errors, accepted column names (first non-empty wins)
+_NAME_COLUMNS = ('name', 'Name')
+_FIELDS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ('lambda_', 'lambda', ('lambda', 'Lambda', 'lambda_')),
+    ('mu', 'mu', ('mu', 'Mu')),
+    ('rho', 'rho', ('rho', 'Rho')),
+    ('xr_percent', 'xr_percent', ('xr_percent', 'xr', 'xr%')),
+    ('xmax_percent', 'xmax_percent', ('xmax_percent', 'xmax', 'xmax%')),
+)
+
 
 def _require_float(s: str | float | int | None, field: str, row: int) -> float:
     """Parse *s* as float or raise ``ValueError`` with row context."""
@@ -21,33 +32,51 @@ def _require_float(s: str | float | int | None, field: str, row: int) -> float:
         raise ValueError(f"Invalid number for {field!r} in row {row}: {s}") from exc
 
 
-def load_materials() -> List[Dict[str, float | str]]:
-    """Load material presets from context/materials.csv if present.
+def _first(row: Dict[str, Optional[str]], columns: Iterable[str]) -> Optional[str]:
+    """Return the first non-empty value of ``columns`` in ``row``."""
+    return next((row.get(c) for c in columns if row.get(c)), None)
 
-    Expected columns (case-insensitive, flexible order):
-    name, lambda, mu, rho, xr_percent, xmax_percent
-    """
-    if not MATERIALS_CSV.exists():
-        return []
+
+def _parse_row(row: Dict[str, Optional[str]], idx: int) -> Dict[str, float | str]:
+    name = (_first(row, _NAME_COLUMNS) or '').strip()
+    if not name:
+        raise ValueError(f"Missing value for 'name' in row {idx}")
+    out: Dict[str, float | str] = {'name': name}
+    try:
+        for key, label, columns in _FIELDS:
+            out[key] = _require_float(_first(row, columns), label, idx)
+    except ValueError as exc:
+        raise ValueError(f"Error parsing materials.csv: {exc}")
+    return out
+
+
+def _load_rows_csv(path: Path) -> List[Dict[str, float | str]]:
     out: List[Dict[str, float | str]] = []
-    with MATERIALS_CSV.open('r', encoding='utf-8') as f:
+    with path.open('r', encoding='utf-8') as f:
         rdr = csv.DictReader(f)
         for idx, row in enumerate(rdr, start=2):  # header is row 1
             if not any(row.values()):
                 continue
-            name = (row.get('name') or row.get('Name') or '').strip()
-            if not name:
-                raise ValueError(f"Missing value for 'name' in row {idx}")
-            try:
-                out.append({
-                    'name': name,
-                    'lambda_': _require_float(row.get('lambda') or row.get('Lambda') or row.get('lambda_'), 'lambda', idx),
-                    'mu': _require_float(row.get('mu') or row.get('Mu'), 'mu', idx),
-                    'rho': _require_float(row.get('rho') or row.get('Rho'), 'rho', idx),
-                    'xr_percent': _require_float(row.get('xr_percent') or row.get('xr') or row.get('xr%'), 'xr_percent', idx),
-                    'xmax_percent': _require_float(row.get('xmax_percent') or row.get('xmax') or row.get('xmax%'), 'xmax_percent', idx),
-                })
-            except ValueError as exc:
-                raise ValueError(f"Error parsing materials.csv: {exc}")
+            out.append(_parse_row(row, idx))
     return out
 
+
+def load_materials() -> List[Dict[str, float | str]]:
+    """Load material presets from context/materials.csv if present.
+
+    Expected columns (case-insensitive, flexible order):
+    name, lambda, mu, rho, xr_percent, xmax_percent
+
+    The parsed file is cached until its mtime or size changes; each call
+    returns fresh dicts.
+    """
+    try:
+        st = MATERIALS_CSV.stat()
+    except OSError:
+        return []
+    return [dict(m) for m in _load_materials_cached(MATERIALS_CSV, st.st_mtime_ns, st.st_size)]
+
+
+@lru_cache(maxsize=4)
+def _load_materials_cached(path: Path, mtime_ns: int, size: int) -> Tuple[Dict[str, float | str], ...]:
+    return tuple(_load_rows_csv(path))
@@ -7,53 +7,87 @@ unavailable, the report gracefully degrades and still renders a compact summary.
 from __future__ import annotations
 
 import base64
+import os
+import threading
 from io import BytesIO
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
 
 try:  # pragma: no cover - matplotlib is optional at runtime
     import matplotlib
 
     matplotlib.use("Agg")
     import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 except Exception:  # pragma: no cover - gracefully degrade if missing
     plt = None  # type: ignore
 
 try:  # pragma: no cover - tables are optional
-    from .tables import p_max_tabulated, theta_s_tabulated
+    from .tables import p_max_tabulated_vec, theta_s_tabulated
 except Exception:  # pragma: no cover
-    p_max_tabulated = None  # type: ignore
+    p_max_tabulated_vec = None  # type: ignore
     theta_s_tabulated = None  # type: ignore
 
 
+# One Figure/Axes per chart kind, cleared and redrawn on every report instead
+# of building a new figure each time. Figures are not registered with pyplot;
+# the lock serializes drawing (e.g. concurrent Flask requests).
+_FIGURES: Dict[str, tuple] = {}
+_FIG_LOCK = threading.Lock()
+
+
+def _chart_axes(kind: str):
+    fig_ax = _FIGURES.get(kind)
+    if fig_ax is None:
+        fig = Figure()
+        fig_ax = _FIGURES[kind] = (fig, fig.add_subplot())
+    fig, ax = fig_ax
+    ax.clear()
+    return fig, ax
+
+
+def _plot_data(values: Iterable[float] | np.ndarray) -> np.ndarray:
+    """Chart input as a float64 array, converted once for Matplotlib."""
+    if not isinstance(values, (np.ndarray, list, tuple)):
+        values = list(values)
+    return np.asarray(values, dtype=np.float64)
+
+
 def _encode_fig(fig) -> str:
     buf = BytesIO()
     fig.savefig(buf, format="png", bbox_inches="tight")
-    plt.close(fig)
-    return base64.b64encode(buf.getvalue()).decode("ascii")
+    # Encode straight from the buffer's memoryview, without a bytes copy
+    return base64.b64encode(buf.getbuffer()).decode("ascii")
 
 
-def _plot_temperature(xs: Iterable[float], ys: Iterable[float]) -> str:
+def _plot_temperature(xs: Iterable[float] | np.ndarray, ys: Iterable[float] | np.ndarray) -> str:
     if plt is None:
         return ""
-    fig, ax = plt.subplots()
-    ax.plot(list(xs), list(ys))
-    ax.set_xlabel("Thickness x [m]")
-    ax.set_ylabel("θ [°C]")
-    ax.set_title("Temperature profile")
-    return _encode_fig(fig)
-
-
-def _plot_vapor(xs: Iterable[float], p: Iterable[float], ps: Iterable[float]) -> str:
+    with _FIG_LOCK:
+        fig, ax = _chart_axes("temperature")
+        ax.plot(_plot_data(xs), _plot_data(ys))
+        ax.set_xlabel("Thickness x [m]")
+        ax.set_ylabel("θ [°C]")
+        ax.set_title("Temperature profile")
+        return _encode_fig(fig)
+
+
+def _plot_vapor(
+    xs: Iterable[float] | np.ndarray, p: Iterable[float] | np.ndarray, ps: Iterable[float] | np.ndarray
+) -> str:
     if plt is None:
         return ""
-    fig, ax = plt.subplots()
-    ax.plot(list(xs), list(p), label="p")
-    ax.plot(list(xs), list(ps), label="p_sat")
-    ax.set_xlabel("z [m²Pa·h/kg]")
-    ax.set_ylabel("p [Pa]")
-    ax.set_title("Vapor pressure profile")
-    ax.legend()
-    return _encode_fig(fig)
+    with _FIG_LOCK:
+        fig, ax = _chart_axes("vapor")
+        x = _plot_data(xs)
+        ax.plot(x, _plot_data(p), label="p")
+        ax.plot(x, _plot_data(ps), label="p_sat")
+        ax.set_xlabel("z [m²Pa·h/kg]")
+        ax.set_ylabel("p [Pa]")
+        ax.set_title("Vapor pressure profile")
+        ax.legend()
+        return _encode_fig(fig)
 
 
 def _tab21(theta_i: float | None, phi_i: float | None) -> str:
@@ -74,16 +108,16 @@ def _tab21(theta_i: float | None, phi_i: float | None) -> str:
 
 
 def _tab22(temps: Iterable[float]) -> str:
-    if p_max_tabulated is None:
+    if p_max_tabulated_vec is None:
         return "<p>Tab. 2.2 unavailable.</p>"
+    ts = list(temps)[:5]
+    try:
+        ps = p_max_tabulated_vec(ts)  # type: ignore[misc]
+    except Exception:
+        ps = None
     rows: List[Tuple[float, float]] = []
-    for T in list(temps)[:5]:
-        try:
-            p = p_max_tabulated(T)  # type: ignore[misc]
-        except Exception:
-            p = None
-        if p is not None:
-            rows.append((T, float(p)))
+    if ps is not None:
+        rows = [(T, p) for T, p in zip(ts, ps.tolist()) if p == p]
     if not rows:
         return "<p>Tab. 2.2 unavailable.</p>"
     trs = "".join(
@@ -96,50 +130,53 @@ def _tab22(temps: Iterable[float]) -> str:
     )
 
 
-def report(results: dict) -> str:
-    """Generate an HTML report from analysis results with charts and table data."""
+def report(results: dict, charts: bool = True) -> str:
+    """Generate an HTML report from analysis results with charts and table data.
+
+    Charts are skipped when ``charts`` is False or the environment variable
+    ``TECCONDENSE_NO_CHARTS`` is set (e.g. headless batch runs).
+    """
 
     surface = results.get("surface", {})
     zones = results.get("zones", [])
-    lis = [
-        f"<li>U-value: {results.get('U', float('nan')):.4f} W/m²·K</li>",
-        f"<li>ΣR: {results.get('R_total', float('nan')):.4f} m²·K/W</li>",
-        f"<li>q: {results.get('q', float('nan')):.3f} W/m²</li>",
-        f"<li>Surface: {'OK' if not surface.get('risk') else 'Fail'} (θsi={surface.get('theta_si', float('nan')):.2f}°C vs θs={surface.get('theta_s', float('nan')):.2f}°C)</li>",
-        f"<li>pᵢ={results.get('p_i', float('nan')):.0f} Pa, pₑ={results.get('p_e', float('nan')):.0f} Pa</li>",
-        f"<li>Condensation: {'Yes' if zones else 'No'}</li>",
-    ]
-
-    temp_chart = _plot_temperature(
-        results.get("thickness_axis", []), results.get("theta_profile", [])
-    )
-    vapor_chart = _plot_vapor(
-        results.get("vapor_axis", []),
-        results.get("p_line", []),
-        results.get("p_sat", []),
-    )
+    nan = float("nan")
+
+    if charts and os.environ.get("TECCONDENSE_NO_CHARTS", "") in ("", "0"):
+        temp_chart = _plot_temperature(
+            results.get("thickness_axis", []), results.get("theta_profile", [])
+        )
+        vapor_chart = _plot_vapor(
+            results.get("vapor_axis", []),
+            results.get("p_line", []),
+            results.get("p_sat", []),
+        )
+    else:
+        temp_chart = vapor_chart = ""
 
     tab21_html = _tab21(results.get("theta_i"), results.get("phi_i"))
     tab22_html = _tab22(results.get("theta_profile", []))
 
+    # Optional fragments carry their own line break so absent ones leave no gap
+    temp_img = f"<img src='data:image/png;base64,{temp_chart}' alt='Temperature chart' />\n" if temp_chart else ""
+    vapor_img = f"<img src='data:image/png;base64,{vapor_chart}' alt='Vapor chart' />\n" if vapor_chart else ""
     proof = results.get("proof")
     if isinstance(proof, list) and proof:
-        proof_html = "<h3>Calculation steps</h3><pre>" + "\n".join(str(s) for s in proof) + "</pre>"
+        steps = "\n".join(str(s) for s in proof)
+        proof_html = f"\n<h3>Calculation steps</h3><pre>{steps}</pre>"
     else:
         proof_html = ""
 
-    parts = [
-        "<h2>Condensation Risk Report</h2>",
-        "<ul>",
-        *lis,
-        "</ul>",
-        "<h3>Charts</h3>",
-        (f"<img src='data:image/png;base64,{temp_chart}' alt='Temperature chart' />" if temp_chart else ""),
-        (f"<img src='data:image/png;base64,{vapor_chart}' alt='Vapor chart' />" if vapor_chart else ""),
-        "<h3>Tab. 2.1 excerpt</h3>",
-        tab21_html,
-        "<h3>Tab. 2.2 excerpt</h3>",
-        tab22_html,
-        proof_html,
-    ]
-    return "\n".join([p for p in parts if p])
+    return f"""<h2>Condensation Risk Report</h2>
+<ul>
+<li>U-value: {results.get('U', nan):.4f} W/m²·K</li>
+<li>ΣR: {results.get('R_total', nan):.4f} m²·K/W</li>
+<li>q: {results.get('q', nan):.3f} W/m²</li>
+<li>Surface: {'OK' if not surface.get('risk') else 'Fail'} (θsi={surface.get('theta_si', nan):.2f}°C vs θs={surface.get('theta_s', nan):.2f}°C)</li>
+<li>pᵢ={results.get('p_i', nan):.0f} Pa, pₑ={results.get('p_e', nan):.0f} Pa</li>
+<li>Condensation: {'Yes' if zones else 'No'}</li>
+</ul>
+<h3>Charts</h3>
+{temp_img}{vapor_img}<h3>Tab. 2.1 excerpt</h3>
+{tab21_html}
+<h3>Tab. 2.2 excerpt</h3>
+{tab22_html}{proof_html}"""
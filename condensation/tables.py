@@ -10,11 +10,35 @@ can fall back to analytical formulas (e.g., Magnus).
 from __future__ import annotations
 
 from typing import Optional, Dict, List, Tuple
+from bisect import bisect_right
+import io
+import os
+import threading
 import zipfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
 import csv
 
+import numpy as np
+
+try:  # Optional JIT compilation of the batch lookup kernel
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except Exception:  # pragma: no cover - optional dependency
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):  # type: ignore
+        """No-op stand-in for :func:`numba.njit`; the kernel runs as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+try:  # Optional C-level batch interpolation when Numba is not available
+    from scipy.interpolate import RegularGridInterpolator
+except Exception:  # pragma: no cover - optional dependency
+    RegularGridInterpolator = None  # type: ignore
+
 
 ROOT = Path(__file__).resolve().parents[1]
 T2_2_XLSX = ROOT / 'context' / 't2-2.xlsx'
@@ -22,43 +46,56 @@ T2_1_XLSX = ROOT / 'context' / 't2-1.xlsx'
 T2_2_CSV = ROOT / 'context' / 't2-2.csv'
 T2_1_CSV = ROOT / 'context' / 't2-1.csv'
 
+# Optional .npz copies of the parsed tables (same opt-in directory as the
+# lookup cache in core); invalidated when a source file changes.
+_CACHE_DIR: Optional[Path] = (
+    Path(os.environ['TECCONDENSE_CACHE_DIR']).expanduser()
+    if os.environ.get('TECCONDENSE_CACHE_DIR')
+    else None
+)
+
 _SST_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_SI, _T, _ROW, _C, _V = (f'{_SST_NS}{tag}' for tag in ('si', 't', 'row', 'c', 'v'))
 
 
 def _read_xlsx_cells(path: Path) -> List[Dict[str, str]]:
     """Return list of rows; each row is {cell_ref: value_string}.
 
     Resolves shared strings and returns raw text (no number formatting).
+    Both XML parts are streamed with ``iterparse``; each ``<si>``/``<row>``
+    element is cleared once read, so no full document tree is kept.
     """
-    with zipfile.ZipFile(path) as z:
-        ws = z.read('xl/worksheets/sheet1.xml')
-        sst = z.read('xl/sharedStrings.xml')
-    sst_root = ET.fromstring(sst)
     strings: List[str] = []
-    for si in sst_root.iter(f'{_SST_NS}si'):
-        t = ''.join(n.text or '' for n in si.iter(f'{_SST_NS}t'))
-        strings.append(t)
-    root = ET.fromstring(ws)
-    sheet_data = root.find(f'{_SST_NS}sheetData')
-    rows_el = list(sheet_data.iter(f'{_SST_NS}row')) if sheet_data is not None else []
     rows: List[Dict[str, str]] = []
-    for r in rows_el:
-        row_map: Dict[str, str] = {}
-        for c in r.iter(f'{_SST_NS}c'):
-            ref = c.attrib.get('r', '')
-            t = c.attrib.get('t')
-            v = c.find(f'{_SST_NS}v')
-            if v is None or v.text is None:
-                continue
-            if t == 's':
-                try:
-                    idx = int(v.text)
-                    row_map[ref] = strings[idx]
-                except Exception:
-                    row_map[ref] = ''
-            else:
-                row_map[ref] = v.text
-        rows.append(row_map)
+    with zipfile.ZipFile(path) as z:
+        with z.open('xl/sharedStrings.xml') as f:
+            for _event, si in ET.iterparse(f, events=('end',)):
+                if si.tag != _SI:
+                    continue
+                strings.append(''.join(n.text or '' for n in si.iter(_T)))
+                si.clear()
+        with z.open('xl/worksheets/sheet1.xml') as f:
+            for _event, r in ET.iterparse(f, events=('end',)):
+                if r.tag != _ROW:
+                    continue
+                row_map: Dict[str, str] = {}
+                for c in r:
+                    if c.tag != _C:
+                        continue
+                    v = c.find(_V)
+                    if v is None or v.text is None:
+                        continue
+                    attr = c.attrib
+                    ref = attr.get('r', '')
+                    if attr.get('t') == 's':
+                        try:
+                            row_map[ref] = strings[int(v.text)]
+                        except (ValueError, IndexError):
+                            row_map[ref] = ''
+                    else:
+                        row_map[ref] = v.text
+                rows.append(row_map)
+                r.clear()
     return rows
 
 
@@ -69,51 +106,150 @@ def _read_csv_rows(path: Path) -> List[List[str]]:
     return rows
 
 
+# Characters dropped from CSV text before the numeric fast path
+_CSV_STRIP = str.maketrans('', '', '\u00a0 ')
+
+
+def _load_csv_array(path: Path) -> Optional[np.ndarray]:
+    """Whole CSV as a 2-D float64 array via :func:`numpy.loadtxt`.
+
+    Returns None if the file is not a plain numeric grid (ragged rows, empty
+    cells, text); callers then fall back to the per-cell parser.
+    """
+    text = path.read_text(encoding='utf-8').translate(_CSV_STRIP)
+    try:
+        return np.loadtxt(io.StringIO(text), delimiter=',', dtype=np.float64, ndmin=2)
+    except ValueError:
+        return None
+
+
+# Drops NBSPs/spaces and turns decimal commas into points in one pass
+_TO_FLOAT_TRANS = str.maketrans({'\u00a0': None, ' ': None, ',': '.'})
+
+
 def _to_float(s: str) -> Optional[float]:
-    if s is None:
+    if not s:
         return None
-    s = s.strip().replace('\u00a0', ' ').replace(' ', '')
-    # replace comma decimal separator
-    s = s.replace(',', '.')
     try:
-        return float(s)
-    except Exception:
+        return float(s.translate(_TO_FLOAT_TRANS))
+    except ValueError:
         return None
 
 
 # Cache containers
-_pmax_table: Optional[Tuple[List[float], Dict[float, float]]] = None
-_thetas_table: Optional[Tuple[List[float], List[float], List[List[float]]]] = None
+# Tab. 2.2 as sorted (T, p) Python float lists for scalar lookups
+_pmax_table: Optional[Tuple[List[float], List[float]]] = None
+# Tab. 2.1 as float64 (θi, φi, grid) arrays; grid is C-contiguous with shape
+# (len(θi), len(φi))
+_thetas_table: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+# 1/Δθi and 1/Δφi index-aligned with the upper bracket node (see _inv_deltas)
+_thetas_inv: Optional[Tuple[np.ndarray, np.ndarray]] = None
+# SciPy interpolator over Tab. 2.1 for batch lookups without Numba
+_thetas_rgi = None
+# Tab. 2.2 as sorted (T, p) float64 arrays for vectorized lookups
+_pmax_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+# Outcome of the one load attempt per table (None: not tried yet). Loads run
+# under _TABLES_LOCK; readers only test the flag, which is set last.
+_pmax_loaded: Optional[bool] = None
+_thetas_loaded: Optional[bool] = None
+_TABLES_LOCK = threading.Lock()
+
+
+def _sources_stamp(*paths: Path) -> np.ndarray:
+    """(mtime_ns, size) of each source file, -1 for missing ones."""
+    stamp: List[int] = []
+    for path in paths:
+        try:
+            st = path.stat()
+            stamp += [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stamp += [-1, -1]
+    return np.array(stamp, dtype=np.int64)
+
+
+def _load_sidecar(name: str, stamp: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+    if _CACHE_DIR is None:
+        return None
+    try:
+        with np.load(_CACHE_DIR / f'{name}.npz', allow_pickle=False) as data:
+            if not np.array_equal(data['stamp'], stamp):
+                return None
+            return {k: data[k] for k in data.files}
+    except Exception:
+        return None
+
+
+def _save_sidecar(name: str, stamp: np.ndarray, **arrays: np.ndarray) -> None:
+    if _CACHE_DIR is None:
+        return
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = _CACHE_DIR / f'{name}.tmp.npz'
+        np.savez(tmp, stamp=stamp, **arrays)
+        os.replace(tmp, _CACHE_DIR / f'{name}.npz')
+    except OSError:
+        pass
 
 
 def _ensure_pmax_table() -> bool:
-    global _pmax_table
-    if _pmax_table is not None:
+    global _pmax_loaded
+    if _pmax_loaded is not None:
+        return _pmax_loaded
+    with _TABLES_LOCK:
+        if _pmax_loaded is None:
+            _pmax_loaded = _load_pmax_table()
+    return _pmax_loaded
+
+
+def _load_pmax_table() -> bool:
+    stamp = _sources_stamp(T2_2_CSV, T2_2_XLSX)
+    cached = _load_sidecar('t2-2', stamp)
+    if cached is not None and cached['xs'].size:
+        _set_pmax_table(dict(zip(cached['xs'].tolist(), cached['ps'].tolist())))
         return True
+    # An empty table counts as unavailable and is not written to the sidecar
+    if not _parse_pmax_table() or not _pmax_arrays[0].size:  # type: ignore
+        return False
+    xs_arr, ps_arr = _pmax_arrays  # type: ignore
+    _save_sidecar('t2-2', stamp, xs=xs_arr, ps=ps_arr)
+    return True
+
+
+def _parse_pmax_table() -> bool:
+    global _pmax_table
     # Prefer CSV if available
     if T2_2_CSV.exists():
         try:
-            rows_csv = _read_csv_rows(T2_2_CSV)
-            mapping: Dict[float, float] = {}
-            temps: List[float] = []
-            for row in rows_csv:
-                if not row:
-                    continue
-                base = _to_float(row[0])
-                if base is None:
-                    continue
-                for j in range(1, min(11, len(row))):
-                    v = _to_float(row[j])
-                    if v is None:
+            arr = _load_csv_array(T2_2_CSV)
+            if arr is not None and arr.shape[1] > 1:
+                ncol = min(11, arr.shape[1])
+                T = (arr[:, :1] + 0.1 * np.arange(ncol - 1)).ravel()
+                P = arr[:, 1:ncol].ravel()
+                ok = ~(np.isnan(T) | np.isnan(P))
+                # np.unique keeps the first occurrence of duplicate temperatures
+                temps_u, first = np.unique(T[ok], return_index=True)
+                if temps_u.size:
+                    _set_pmax_table(dict(zip(temps_u.tolist(), P[ok][first].tolist())))
+                    return True
+            else:
+                rows_csv = _read_csv_rows(T2_2_CSV)
+                mapping: Dict[float, float] = {}
+                for row in rows_csv:
+                    if not row:
                         continue
-                    T = base + 0.1 * (j - 1)
-                    if T not in mapping:  # keep first occurrence for duplicates
-                        mapping[T] = v
-                        temps.append(T)
-            temps_sorted = sorted(set(temps))
-            if temps_sorted:
-                _pmax_table = (temps_sorted, mapping)
-                return True
+                    base = _to_float(row[0])
+                    if base is None:
+                        continue
+                    for j in range(1, min(11, len(row))):
+                        v = _to_float(row[j])
+                        if v is None:
+                            continue
+                        T = base + 0.1 * (j - 1)
+                        if T not in mapping:  # keep first occurrence for duplicates
+                            mapping[T] = v
+                if mapping:
+                    _set_pmax_table(mapping)
+                    return True
         except Exception:
             pass
     # Fallback to XLSX if present
@@ -129,7 +265,6 @@ def _ensure_pmax_table() -> bool:
                 return False
             decs.append(f)
         mapping: Dict[float, float] = {}
-        temps: List[float] = []
         for r_idx in range(4, len(rows)):
             a = rows[r_idx].get('A' + str(r_idx + 1))
             base = _to_float(a) if a is not None else None
@@ -143,76 +278,134 @@ def _ensure_pmax_table() -> bool:
                 T = base + decs[j]
                 if T not in mapping:
                     mapping[T] = p_pa
-                    temps.append(T)
-        temps_sorted = sorted(set(temps))
-        _pmax_table = (temps_sorted, mapping)
+        _set_pmax_table(mapping)
         return True
     except Exception:
         _pmax_table = None
         return False
 
 
-def _interp1(x: float, xs: List[float], mapping: Dict[float, float]) -> Optional[float]:
-    if not xs:
-        return None
-    # Clamp endpoints
-    if x <= xs[0]:
-        return mapping.get(xs[0])
-    if x >= xs[-1]:
-        return mapping.get(xs[-1])
-    # Find bracketing indices
-    for i in range(1, len(xs)):
-        if x <= xs[i]:
-            x0, x1 = xs[i - 1], xs[i]
-            y0, y1 = mapping[x0], mapping[x1]
-            t = (x - x0) / (x1 - x0)
-            return y0 + t * (y1 - y0)
-    return None
+def _set_pmax_table(mapping: Dict[float, float]) -> None:
+    """Store Tab. 2.2 from a {T: p} mapping, sorted by T with ``np.argsort``."""
+    global _pmax_table, _pmax_arrays
+    temps = np.fromiter(mapping.keys(), dtype=np.float64, count=len(mapping))
+    ps = np.fromiter(mapping.values(), dtype=np.float64, count=len(mapping))
+    order = np.argsort(temps, kind='stable')
+    _pmax_arrays = (temps[order], ps[order])
+    _pmax_table = (_pmax_arrays[0].tolist(), _pmax_arrays[1].tolist())
+
+
+# Per-thread index of the last Tab. 2.2 bracket; profiles query neighbouring
+# temperatures, so the next lookup usually hits the same or an adjacent one.
+_pmax_hint = threading.local()
 
 
 def p_max_tabulated(T_celsius: float) -> Optional[float]:
-    """Return p_max(T) in Pa using Tab. 2.2, or None if table unavailable."""
+    """Return p_max(T) in Pa using Tab. 2.2, or None if table unavailable.
+
+    Linear interpolation with the same formula as :func:`numpy.interp`;
+    temperatures outside the table are clamped to its end values. The bracket
+    of the previous call (and its neighbours) is tried before a binary search.
+    Returns None for an empty table as well.
+    """
+    if not _ensure_pmax_table() or T_celsius != T_celsius:  # NaN: no bracket
+        return None
+    xs, ps = _pmax_table  # type: ignore
+    last = len(xs) - 1
+    if last < 0:
+        return None
+    if T_celsius <= xs[0]:
+        return ps[0]
+    if T_celsius >= xs[last]:
+        return ps[last]
+    # The hint may be left over from a larger table (after a reload)
+    i = getattr(_pmax_hint, 'i', 0)
+    if i >= last or not xs[i] <= T_celsius < xs[i + 1]:
+        if i + 2 <= last and xs[i + 1] <= T_celsius < xs[i + 2]:
+            i += 1
+        elif 0 < i <= last and xs[i - 1] <= T_celsius < xs[i]:
+            i -= 1
+        else:
+            i = bisect_right(xs, T_celsius) - 1
+        _pmax_hint.i = i
+    slope = (ps[i + 1] - ps[i]) / (xs[i + 1] - xs[i])
+    return slope * (T_celsius - xs[i]) + ps[i]
+
+
+def p_max_tabulated_vec(T_celsius) -> Optional[np.ndarray]:
+    """Vectorized :func:`p_max_tabulated` over an array of temperatures.
+
+    Returns None if the table is unavailable or empty.
+    """
     if not _ensure_pmax_table():
         return None
-    xs, mapping = _pmax_table  # type: ignore
-    return _interp1(T_celsius, xs, mapping)  # type: ignore
+    xs, ps = _pmax_arrays  # type: ignore
+    if not xs.size:
+        return None
+    return np.interp(np.asarray(T_celsius, dtype=np.float64), xs, ps)
 
 
 def _ensure_thetas_table() -> bool:
-    global _thetas_table
-    if _thetas_table is not None:
+    global _thetas_loaded
+    if _thetas_loaded is not None:
+        return _thetas_loaded
+    with _TABLES_LOCK:
+        if _thetas_loaded is None:
+            _thetas_loaded = _load_thetas_table()
+    return _thetas_loaded
+
+
+def _load_thetas_table() -> bool:
+    stamp = _sources_stamp(T2_1_CSV, T2_1_XLSX)
+    cached = _load_sidecar('t2-1', stamp)
+    if cached is not None:
+        _set_thetas_table(cached['thetas'], cached['phis'], cached['grid'])
         return True
+    if not _parse_thetas_table():
+        return False
+    thetas, phis, grid = _thetas_table  # type: ignore
+    _save_sidecar('t2-1', stamp, thetas=thetas, phis=phis, grid=grid)
+    return True
+
+
+def _parse_thetas_table() -> bool:
+    global _thetas_table
     # Prefer CSV if available
     if T2_1_CSV.exists():
         try:
-            rows_csv = _read_csv_rows(T2_1_CSV)
             # No header assumed; columns: base θi, then 14 values for φ=30..95 step 5
             phis = [float(p) for p in range(30, 100, 5)]
             thetas: List[float] = []
             grid: List[List[float]] = []
-            for row in rows_csv:
-                if not row:
-                    continue
-                base = _to_float(row[0])
-                if base is None:
-                    continue
-                vals: List[float] = []
-                for j in range(1, min(1 + len(phis), len(row))):
-                    v = _to_float(row[j])
-                    if v is None:
-                        vals.append(float('nan'))
-                    else:
-                        vals.append(v)
-                # If shorter than phis, pad with NaN
-                if len(vals) < len(phis):
-                    vals.extend([float('nan')] * (len(phis) - len(vals)))
-                thetas.append(base)
-                grid.append(vals)
+            arr = _load_csv_array(T2_1_CSV)
+            if arr is not None and arr.size:
+                vals_arr = np.full((arr.shape[0], len(phis)), np.nan)
+                k = min(len(phis), arr.shape[1] - 1)
+                vals_arr[:, :k] = arr[:, 1:1 + k]
+                _set_thetas_table(arr[:, 0], phis, vals_arr)
+                return True
+            else:
+                rows_csv = _read_csv_rows(T2_1_CSV)
+                for row in rows_csv:
+                    if not row:
+                        continue
+                    base = _to_float(row[0])
+                    if base is None:
+                        continue
+                    vals: List[float] = []
+                    for j in range(1, min(1 + len(phis), len(row))):
+                        v = _to_float(row[j])
+                        if v is None:
+                            vals.append(float('nan'))
+                        else:
+                            vals.append(v)
+                    # If shorter than phis, pad with NaN
+                    if len(vals) < len(phis):
+                        vals.extend([float('nan')] * (len(phis) - len(vals)))
+                    thetas.append(base)
+                    grid.append(vals)
             if thetas:
-                order = sorted(range(len(thetas)), key=lambda i: thetas[i])
-                thetas_sorted = [thetas[i] for i in order]
-                grid_sorted = [grid[i] for i in order]
-                _thetas_table = (thetas_sorted, phis, grid_sorted)
+                _set_thetas_table(thetas, phis, grid)
                 return True
         except Exception:
             pass
@@ -248,57 +441,83 @@ def _ensure_thetas_table() -> bool:
             if any(v == v for v in row_vals):
                 thetas.append(theta_i)
                 grid.append(row_vals)
-        order = sorted(range(len(thetas)), key=lambda i: thetas[i])
-        thetas_sorted = [thetas[i] for i in order]
-        grid_sorted = [grid[i] for i in order]
-        _thetas_table = (thetas_sorted, phis, grid_sorted)
+        _set_thetas_table(thetas, phis, grid)
         return True
     except Exception:
         _thetas_table = None
         return False
 
 
-def _interp2(x: float, y: float, xs: List[float], ys: List[float], grid: List[List[float]]) -> Optional[float]:
-    # Clamp to bounds
-    if not xs or not ys:
+def _set_thetas_table(thetas, phis, grid) -> None:
+    """Store Tab. 2.1 from θi, φi and a row-per-θi grid (lists or arrays).
+
+    Rows are put in ascending θi order with a stable ``np.argsort``.
+    """
+    global _thetas_table, _thetas_inv, _thetas_rgi
+    thetas_arr = np.asarray(thetas, dtype=np.float64)
+    phis_arr = np.asarray(phis, dtype=np.float64)
+    grid_arr = np.asarray(grid, dtype=np.float64).reshape(thetas_arr.size, phis_arr.size)
+    order = np.argsort(thetas_arr, kind='stable')
+    thetas_arr = thetas_arr[order]
+    grid_arr = np.ascontiguousarray(grid_arr[order])
+    _thetas_inv = (_inv_deltas(thetas_arr), _inv_deltas(phis_arr))
+    _thetas_rgi = None
+    if not _HAS_NUMBA and RegularGridInterpolator is not None:
+        try:
+            _thetas_rgi = RegularGridInterpolator(
+                (thetas_arr, phis_arr), grid_arr, method='linear', bounds_error=False, fill_value=np.nan
+            )
+        except ValueError:  # e.g. repeated θi rows or a single-node axis
+            pass
+    _thetas_table = (thetas_arr, phis_arr, grid_arr)
+
+
+def _inv_deltas(axis: np.ndarray) -> np.ndarray:
+    """``inv[i] = 1 / (axis[i] - axis[i-1])``; 0 at index 0 and for repeated nodes."""
+    inv = np.zeros(axis.size)
+    if axis.size > 1:
+        d = np.diff(axis)
+        np.divide(1.0, d, out=inv[1:], where=d != 0)
+    return inv
+
+
+def _bracket(v: float, axis: np.ndarray, inv: np.ndarray) -> Tuple[int, int, float]:
+    """Return (i0, i1, t) with ``v`` clamped to ``axis`` and
+    ``axis[i0] <= v <= axis[i1]``, ``t`` the fraction between them."""
+    n = axis.shape[0]
+    if n == 1:
+        return 0, 0, 0.0
+    v = min(max(v, axis[0]), axis[-1])
+    i1 = min(max(int(np.searchsorted(axis, v)), 1), n - 1)
+    i0 = i1 - 1
+    return i0, i1, float((v - axis[i0]) * inv[i1])
+
+
+def _interp2(
+    x: float,
+    y: float,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    grid: np.ndarray,
+    inv_x: np.ndarray,
+    inv_y: np.ndarray,
+) -> Optional[float]:
+    """Bilinear interpolation on ``grid[i, j] = f(xs[i], ys[j])``, clamped to the
+    table edges. Brackets are found by binary search on the sorted axes;
+    ``inv_x``/``inv_y`` are the axes' :func:`_inv_deltas`."""
+    if xs.size == 0 or ys.size == 0 or x != x or y != y:  # NaN: no bracket
         return None
-    # Find i such that xs[i0] <= x <= xs[i1]
-    if x <= xs[0]:
-        i0, i1 = 0, 0
-    elif x >= xs[-1]:
-        i0, i1 = len(xs) - 1, len(xs) - 1
-    else:
-        i1 = next(i for i in range(1, len(xs)) if x <= xs[i])
-        i0 = i1 - 1
-    if y <= ys[0]:
-        j0, j1 = 0, 0
-    elif y >= ys[-1]:
-        j0, j1 = len(ys) - 1, len(ys) - 1
-    else:
-        j1 = next(j for j in range(1, len(ys)) if y <= ys[j])
-        j0 = j1 - 1
-    x0, x1 = xs[i0], xs[i1]
-    y0, y1 = ys[j0], ys[j1]
-    f00 = grid[i0][j0]
-    f01 = grid[i0][j1]
-    f10 = grid[i1][j0]
-    f11 = grid[i1][j1]
-    if i0 == i1 and j0 == j1:
-        return f00
-    if i0 == i1:
-        # linear in y only
-        ty = 0.0 if y1 == y0 else (y - y0) / (y1 - y0)
-        return f00 + ty * (f01 - f00)
-    if j0 == j1:
-        # linear in x only
-        tx = 0.0 if x1 == x0 else (x - x0) / (x1 - x0)
-        return f00 + tx * (f10 - f00)
-    # bilinear
-    tx = 0.0 if x1 == x0 else (x - x0) / (x1 - x0)
-    ty = 0.0 if y1 == y0 else (y - y0) / (y1 - y0)
+    i0, i1, tx = _bracket(x, xs, inv_x)
+    j0, j1, ty = _bracket(y, ys, inv_y)
+    f00 = grid[i0, j0]
+    if tx == 0.0 and ty == 0.0:
+        return float(f00)
+    f01 = grid[i0, j1]
+    f10 = grid[i1, j0]
+    f11 = grid[i1, j1]
     f0 = f00 + tx * (f10 - f00)
     f1 = f01 + tx * (f11 - f01)
-    return f0 + ty * (f1 - f0)
+    return float(f0 + ty * (f1 - f0))
 
 
 def theta_s_tabulated(theta_i: float, phi_i: float) -> Optional[float]:
@@ -306,4 +525,68 @@ def theta_s_tabulated(theta_i: float, phi_i: float) -> Optional[float]:
     if not _ensure_thetas_table():
         return None
     thetas, phis, grid = _thetas_table  # type: ignore
-    return _interp2(theta_i, phi_i, thetas, phis, grid)  # type: ignore
+    return _interp2(theta_i, phi_i, thetas, phis, grid, *_thetas_inv)  # type: ignore
+
+
+@njit(cache=True, parallel=True)
+def _interp2_vec(
+    x: np.ndarray,
+    y: np.ndarray,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    grid: np.ndarray,
+    inv_x: np.ndarray,
+    inv_y: np.ndarray,
+) -> np.ndarray:
+    """:func:`_interp2` over equal-length float64 query arrays (NaN for NaN queries).
+
+    Compiled with Numba when available (queries are independent and spread
+    over threads with ``prange``), otherwise runs as a Python loop.
+    """
+    nx, ny = xs.shape[0], ys.shape[0]
+    out = np.empty(x.shape[0])
+    for k in prange(x.shape[0]):
+        xk, yk = x[k], y[k]
+        if xk != xk or yk != yk:
+            out[k] = np.nan
+            continue
+        xk = min(max(xk, xs[0]), xs[nx - 1])
+        yk = min(max(yk, ys[0]), ys[ny - 1])
+        i1 = min(max(np.searchsorted(xs, xk), 1), nx - 1)
+        j1 = min(max(np.searchsorted(ys, yk), 1), ny - 1)
+        i0, j0 = max(i1 - 1, 0), max(j1 - 1, 0)
+        tx = (xk - xs[i0]) * inv_x[i1]
+        ty = (yk - ys[j0]) * inv_y[j1]
+        f00 = grid[i0, j0]
+        if tx == 0.0 and ty == 0.0:
+            out[k] = f00
+            continue
+        f0 = f00 + tx * (grid[i1, j0] - f00)
+        f1 = grid[i0, j1] + tx * (grid[i1, j1] - grid[i0, j1])
+        out[k] = f0 + ty * (f1 - f0)
+    return out
+
+
+def theta_s_tabulated_vec(theta_i, phi_i) -> Optional[np.ndarray]:
+    """Vectorized :func:`theta_s_tabulated` over broadcastable θi/φi arrays.
+
+    Uses the compiled :func:`_interp2_vec` kernel, or SciPy's
+    ``RegularGridInterpolator`` on clamped inputs when Numba is missing.
+    Returns None if the table is unavailable; NaN inputs give NaN.
+    """
+    if not _ensure_thetas_table():
+        return None
+    thetas, phis, grid = _thetas_table  # type: ignore
+    if thetas.size == 0 or phis.size == 0:
+        return None
+    x, y = np.broadcast_arrays(
+        np.asarray(theta_i, dtype=np.float64), np.asarray(phi_i, dtype=np.float64)
+    )
+    if _thetas_rgi is not None:
+        pts = np.column_stack((
+            np.clip(np.ravel(x), thetas[0], thetas[-1]),
+            np.clip(np.ravel(y), phis[0], phis[-1]),
+        ))
+        return _thetas_rgi(pts).reshape(x.shape)
+    out = _interp2_vec(np.ravel(x), np.ravel(y), thetas, phis, grid, *_thetas_inv)  # type: ignore
+    return out.reshape(x.shape)
@@ -0,0 +1,95 @@
+import copy
+import os
+import sys
+
+# Ensure package root on path for pytest execution
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+from condensation.dataclasses import Layer, Assembly, Climate
+from condensation import core
+from condensation.core import analyze, analyze_batch, compile_solver
+
+
+def test_batch_matches_scalar_analyze():
+    layers = [
+        Layer("layer1", d=0.05, lambda_=0.04, mu=50, rho=200, xr_percent=5, xmax_percent=20),
+        Layer("layer2", d=0.05, lambda_=0.04, mu=10, rho=200, xr_percent=5, xmax_percent=20),
+    ]
+    assembly = Assembly(layers=layers, Rsi=0.13, Rse=0.04)
+    climates = [
+        Climate(theta_i=20, phi_i=100, theta_e=0, phi_e=50),
+        Climate(theta_i=20, phi_i=50, theta_e=5, phi_e=90),
+        Climate(theta_i=20, phi_i=65, theta_e=-10, phi_e=90),
+    ]
+    batch = analyze_batch(assembly, climates, tk_hours=1440, tu_hours=1440)
+    assert batch["theta_profile"].shape == (3, 3)
+    for k, climate in enumerate(climates):
+        res = analyze(assembly, climate, tk_hours=1440, tu_hours=1440)
+        assert batch["theta_profile"][k].tolist() == pytest.approx(res["theta_profile"])
+        assert batch["p_sat"][k].tolist() == pytest.approx(res["p_sat"])
+        assert batch["Wk_total"][k] == pytest.approx(res["Wk_total"])
+        assert batch["internal_condensation"][k] == bool(res["zones"])
+        assert batch["drying_ok"][k] == res["drying_ok"]
+        assert batch["risk"][k] == res["surface"]["risk"]
+    assert batch["Wk_total"][0] > 0
+
+
+def test_compiled_solver_matches_analyze():
+    layers = [
+        Layer("layer1", d=0.05, lambda_=0.04, mu=50, rho=200, xr_percent=5, xmax_percent=20),
+        Layer("layer2", d=0.05, lambda_=0.04, mu=10, rho=200, xr_percent=5, xmax_percent=20),
+    ]
+    assembly = Assembly(layers=layers, Rsi=0.13, Rse=0.04)
+    solve = compile_solver(assembly)
+    for theta_e in (-10, 0, 5):
+        climate = Climate(theta_i=20, phi_i=80, theta_e=theta_e, phi_e=90)
+        assert solve(20, 80, theta_e, 90) == analyze(assembly, climate)
+
+
+def test_compiled_solver_survives_cache_churn():
+    layers = [
+        Layer("layer1", d=0.05, lambda_=0.04, mu=50, rho=200, xr_percent=5, xmax_percent=20),
+        Layer("layer2", d=0.05, lambda_=0.04, mu=10, rho=200, xr_percent=5, xmax_percent=20),
+    ]
+    assembly = Assembly(layers=layers, Rsi=0.13, Rse=0.04)
+    solve = compile_solver(assembly)
+    climate = Climate(theta_i=20, phi_i=80, theta_e=-10, phi_e=90)
+    expected = analyze(assembly, climate)
+
+    # Cleared: solve uses its own plan and leaves the shared caches alone
+    core._assembly_plan.cache_clear()
+    core._compute_core.cache_clear()
+    core._analyze.cache_clear()
+    assert solve(20, 80, -10, 90) == expected
+    assert core._assembly_plan.cache_info().currsize == 0
+    assert core._compute_core.cache_info().currsize == 0
+    assert core._analyze.cache_info().currsize == 0
+
+    # Filled: evict the plan by pushing other assemblies through the cache
+    for i in range(core._assembly_plan.cache_info().maxsize + 1):
+        other = Layer("filler", d=0.01 + i * 1e-4, lambda_=0.5, mu=5, rho=1000, xr_percent=1, xmax_percent=2)
+        core._assembly_plan(Assembly(layers=[other], Rsi=0.13, Rse=0.04))
+    assert solve(20, 80, -10, 90) == expected
+
+
+def test_analyze_results_do_not_share_the_cache():
+    layers = [
+        Layer("layer1", d=0.05, lambda_=0.04, mu=50, rho=200, xr_percent=5, xmax_percent=20),
+        Layer("layer2", d=0.05, lambda_=0.04, mu=10, rho=200, xr_percent=5, xmax_percent=20),
+    ]
+    assembly = Assembly(layers=layers, Rsi=0.13, Rse=0.04)
+    climate = Climate(theta_i=20, phi_i=100, theta_e=0, phi_e=50)
+    first = analyze(assembly, climate, verbose=True)
+    expected = copy.deepcopy(first)
+    assert first["zones"] and first["Wk_layers"]
+
+    first["zones"][0]["start_z"] = -1.0
+    first["Wk_layers"][0]["Wk_layer"] = -1.0
+    first["surface"]["risk"] = "changed"
+    for key, value in first.items():
+        if isinstance(value, (list, dict)):
+            value.clear()
+
+    assert analyze(assembly, climate, verbose=True) == expected
@@ -0,0 +1,123 @@
+import math
+import os
+import random
+import sys
+
+import pytest
+
+# Ensure package root on path for pytest execution
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from condensation.core import condensation_zones
+
+
+def zones_reference(p_line, p_sat_line, z_axis):
+    """The original per-sample state machine, kept as the reference."""
+    zones = []
+    in_zone = False
+    start_z = None
+    max_excess = 0.0
+    n = min(len(p_line), len(p_sat_line), len(z_axis))
+    if n == 0:
+        return zones
+
+    def interp_z(i0, i1):
+        x0, x1 = z_axis[i0], z_axis[i1]
+        y0 = p_line[i0] - p_sat_line[i0]
+        y1 = p_line[i1] - p_sat_line[i1]
+        if y1 == y0:
+            return x0
+        t = -y0 / (y1 - y0)
+        return x0 + t * (x1 - x0)
+
+    prev_excess = p_line[0] - p_sat_line[0]
+    for i in range(1, n):
+        excess = p_line[i] - p_sat_line[i]
+        if in_zone:
+            max_excess = max(max_excess, excess)
+        if prev_excess <= 0 < excess and not in_zone:
+            start_z = interp_z(i - 1, i)
+            in_zone = True
+            max_excess = excess
+        elif prev_excess > 0 and excess <= 0 and in_zone:
+            end_z = interp_z(i - 1, i)
+            zones.append({"start_z": start_z, "end_z": end_z, "max_excess_pa": max(0.0, max_excess)})
+            in_zone = False
+            start_z = None
+            max_excess = 0.0
+        prev_excess = excess
+    if in_zone and start_z is not None:
+        zones.append({"start_z": start_z, "end_z": z_axis[n - 1], "max_excess_pa": max(0.0, max_excess)})
+    return zones
+
+
+def zones_for(excess, z=None):
+    z = list(range(len(excess))) if z is None else z
+    p_sat = [100.0] * len(excess)
+    return condensation_zones([100.0 + e for e in excess], p_sat, z), p_sat, z
+
+
+def assert_same(got, want):
+    assert len(got) == len(want)
+    for g, w in zip(got, want):
+        for key in ("start_z", "end_z", "max_excess_pa"):
+            assert g[key] == pytest.approx(w[key], abs=1e-12)
+
+
+def test_enter_and_leave():
+    zones, _, _ = zones_for([-1, 1, 3, 1, -1])
+    assert_same(zones, [{"start_z": 0.5, "end_z": 3.5, "max_excess_pa": 3.0}])
+
+
+def test_two_zones():
+    zones, _, _ = zones_for([-1, 2, -2, -1, 1, -1])
+    assert_same(
+        zones,
+        [
+            {"start_z": 1 / 3, "end_z": 1.5, "max_excess_pa": 2.0},
+            {"start_z": 3.5, "end_z": 4.5, "max_excess_pa": 1.0},
+        ],
+    )
+
+
+def test_wet_at_z0_is_ignored_until_it_re_enters():
+    zones, _, _ = zones_for([2, 1, -1, 1, -1])
+    assert_same(zones, [{"start_z": 2.5, "end_z": 3.5, "max_excess_pa": 1.0}])
+    assert zones_for([1, 1, -1])[0] == []
+
+
+def test_zone_open_at_the_far_end():
+    zones, _, _ = zones_for([-1, 1, 4], z=[0.0, 2.0, 5.0])
+    assert_same(zones, [{"start_z": 1.0, "end_z": 5.0, "max_excess_pa": 4.0}])
+
+
+def test_nan_samples():
+    nan = float("nan")
+    for excess in ([-1, nan, 1, -1], [-1, 1, nan, 2, -1], [-1, 1, nan], [nan, 1, -1, 1]):
+        p_line = [100.0 + e for e in excess]
+        p_sat = [100.0] * len(excess)
+        z = list(range(len(excess)))
+        got = condensation_zones(p_line, p_sat, z)
+        want = zones_reference(p_line, p_sat, z)
+        assert len(got) == len(want)
+        for g, w in zip(got, want):
+            for key in ("start_z", "end_z", "max_excess_pa"):
+                assert (math.isnan(g[key]) and math.isnan(w[key])) or g[key] == pytest.approx(w[key])
+
+
+def test_empty_and_single_sample():
+    assert condensation_zones([], [], []) == []
+    assert condensation_zones([101.0], [100.0], [0.0]) == []
+
+
+def test_matches_reference_on_random_profiles():
+    rng = random.Random(1234)
+    for _ in range(2000):
+        n = rng.randint(1, 12)
+        z = sorted(rng.uniform(0, 10) for _ in range(n))
+        p_sat = [rng.uniform(500, 1500) for _ in range(n)]
+        p_line = [ps + rng.choice([-1, 1]) * rng.uniform(0, 50) for ps in p_sat]
+        if rng.random() < 0.2:  # exact touch: zero excess at one node
+            i = rng.randrange(n)
+            p_line[i] = p_sat[i]
+        assert_same(condensation_zones(p_line, p_sat, z), zones_reference(p_line, p_sat, z))
@@ -0,0 +1,84 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure package root on path for pytest execution
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from condensation import core
+
+# The compiled kernel and, when Numba is installed, its pure-Python source;
+# without Numba both entries are the same NumPy code path.
+KERNELS = [core._glaser_core, getattr(core._glaser_core, "py_func", core._glaser_core)]
+
+
+def run(kernel, z, diff):
+    """Kernel on p_sat = 100 Pa everywhere and p_lin = p_sat + diff."""
+    z = np.asarray(z, dtype=np.float64)
+    p_sat = np.full(len(z), 100.0)
+    p_lin = p_sat + np.asarray(diff, dtype=np.float64)
+    return kernel(z, p_lin, p_sat)
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_separate_zones_get_connecting_slopes(kernel):
+    zones, z_fin, p_fin = run(kernel, [0, 1, 2, 3, 4], [-1, 1, -1, 1, -1])
+    np.testing.assert_allclose(zones, [[0.5, 1.5, -2.0, 0.0], [2.5, 3.5, 0.0, 2.0]])
+    np.testing.assert_allclose(z_fin, [0.0, 0.5, 2.5, 4.0])
+    np.testing.assert_allclose(p_fin, [99.0, 100.0, 100.0, 99.0])
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_wet_segments_merge_into_one_zone(kernel):
+    zones, z_fin, p_fin = run(kernel, [0, 1, 2, 3, 4], [-1, 1, 2, 1, -1])
+    np.testing.assert_allclose(zones, [[0.5, 3.5, -2.0, 2.0]])
+    np.testing.assert_allclose(z_fin, [0.0, 0.5, 4.0])
+    np.testing.assert_allclose(p_fin, [99.0, 100.0, 99.0])
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_touching_leave_and_enter_are_merged(kernel):
+    # Leaves exactly at z=1 and re-enters there: one zone [0, 2]
+    zones, z_fin, p_fin = run(kernel, [0, 1, 2], [1, 0, 1])
+    np.testing.assert_allclose(zones[:, :2], [[0.0, 2.0]])
+    np.testing.assert_allclose(z_fin, [0.0, 2.0])
+    np.testing.assert_allclose(p_fin, [101.0, 101.0])
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_zone_starting_with_leave(kernel):
+    # Already wet at z=0: the zone opens at the first node
+    zones, z_fin, p_fin = run(kernel, [0, 1, 2], [1, -1, -1])
+    assert zones.shape == (1, 4)
+    start, end, g_before, g_after = zones[0]
+    assert (start, end) == (0.0, 0.5)
+    assert g_before == pytest.approx(1.0 / 1e-12)
+    assert g_after == pytest.approx(2.0 / 3.0)
+    np.testing.assert_allclose(z_fin, [0.0, 2.0])
+    np.testing.assert_allclose(p_fin, [101.0, 99.0])
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_zero_width_zone(kernel):
+    # Enter and leave within zero-thickness (μ·d = 0) segments at z=1
+    zones, z_fin, p_fin = run(kernel, [0, 1, 1, 1, 2], [-1, -1, 1, -1, -1])
+    np.testing.assert_allclose(zones, [[1.0, 1.0, -1.0, 1.0]])
+    np.testing.assert_allclose(z_fin, [0.0, 1.0, 2.0])
+    np.testing.assert_allclose(p_fin, [99.0, 100.0, 99.0])
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_dry_profile_has_no_zones(kernel):
+    zones, z_fin, p_fin = run(kernel, [0, 1, 2], [-1, -2, -1])
+    assert zones.shape == (0, 4)
+    np.testing.assert_allclose(z_fin, [0.0, 1.0, 2.0])
+    np.testing.assert_allclose(p_fin, [99.0, 98.0, 99.0])
+
+
+def test_interp_at_clamps_and_handles_repeated_nodes():
+    z = np.array([0.0, 1.0, 1.0, 2.0])
+    a = np.array([0.0, 10.0, 20.0, 40.0])
+    out = core._interp_at(np.array([-1.0, 0.5, 1.0, 1.5, 3.0]), z, a)
+    np.testing.assert_allclose(out, [0.0, 5.0, 10.0, 30.0, 40.0])
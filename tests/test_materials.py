@@ -38,3 +38,18 @@ def test_load_materials_raises_on_bad_row(tmp_path, monkeypatch):
     monkeypatch.setattr(materials, "MATERIALS_CSV", f)
     with pytest.raises(ValueError):
         materials.load_materials()
+
+
+def test_load_materials_reloads_after_edit(tmp_path, monkeypatch):
+    f = tmp_path / "materials.csv"
+    f.write_text("name,lambda,mu,rho,xr_percent,xmax_percent\nA,0.5,5,1000,1,2\n", encoding="utf-8")
+    monkeypatch.setattr(materials, "MATERIALS_CSV", f)
+    first = materials.load_materials()
+    first[0]["name"] = "changed"
+    assert materials.load_materials()[0]["name"] == "A"
+    f.write_text(
+        "name,lambda,mu,rho,xr_percent,xmax_percent\nA,0.5,5,1000,1,2\nB,0.25,8,500,1,3\n",
+        encoding="utf-8",
+    )
+    assert [m["name"] for m in materials.load_materials()] == ["A", "B"]
+
@@ -18,3 +18,14 @@ def test_report_contains_charts_and_tables():
     assert "id='tab21'" in html
     assert "id='tab22'" in html
     assert "data:image/png;base64" in html
+
+
+def test_report_without_charts(monkeypatch):
+    assembly = Assembly(layers=[Layer(name="Layer1", d=0.1, lambda_=0.04, mu=20, rho=800, xr_percent=5, xmax_percent=20)], Rsi=0.13, Rse=0.04)
+    climate = Climate(theta_i=20.0, phi_i=65.0, theta_e=5.0, phi_e=90.0)
+    results = analyze(assembly, climate)
+    html = rpt.report(results, charts=False)
+    assert "<img" not in html
+    assert "U-value" in html
+    monkeypatch.setenv("TECCONDENSE_NO_CHARTS", "1")
+    assert "<img" not in rpt.report(results)
@@ -0,0 +1,173 @@
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from condensation import tables
+
+
+def _reset(monkeypatch):
+    """Forget both loaded tables so the next lookup loads them again."""
+    for name in (
+        "_pmax_loaded",
+        "_thetas_loaded",
+        "_pmax_table",
+        "_pmax_arrays",
+        "_thetas_table",
+        "_thetas_inv",
+        "_thetas_rgi",
+    ):
+        monkeypatch.setattr(tables, name, None)
+    tables._pmax_hint.i = 0
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    """Private copies of the CSV tables with the sidecars under tmp_path/cache."""
+    context = tmp_path / "context"
+    context.mkdir()
+    for name in ("t2-1.csv", "t2-2.csv"):
+        shutil.copy2(ROOT / "context" / name, context / name)
+    monkeypatch.setattr(tables, "T2_1_CSV", context / "t2-1.csv")
+    monkeypatch.setattr(tables, "T2_2_CSV", context / "t2-2.csv")
+    monkeypatch.setattr(tables, "T2_1_XLSX", context / "t2-1.xlsx")
+    monkeypatch.setattr(tables, "T2_2_XLSX", context / "t2-2.xlsx")
+    monkeypatch.setattr(tables, "_CACHE_DIR", tmp_path / "cache")
+    _reset(monkeypatch)
+    yield context
+    tables._pmax_hint.i = 0
+
+
+def test_sidecars_written_then_reused(sources, monkeypatch):
+    p_before = tables.p_max_tabulated(20.0)
+    theta_before = tables.theta_s_tabulated(20.0, 65.0)
+    assert p_before is not None and theta_before is not None
+    cache = tables._CACHE_DIR
+    assert sorted(p.name for p in cache.iterdir()) == ["t2-1.npz", "t2-2.npz"]
+
+    def no_parse():
+        raise AssertionError("sources parsed although the sidecar is current")
+
+    _reset(monkeypatch)
+    monkeypatch.setattr(tables, "_parse_pmax_table", no_parse)
+    monkeypatch.setattr(tables, "_parse_thetas_table", no_parse)
+    assert tables.p_max_tabulated(20.0) == p_before
+    assert tables.theta_s_tabulated(20.0, 65.0) == theta_before
+
+
+def test_sidecar_rebuilt_after_source_change(sources, monkeypatch):
+    assert tables.p_max_tabulated(30.0) == 4244.0
+    sidecar = tables._CACHE_DIR / "t2-2.npz"
+    with np.load(sidecar) as data:
+        old_stamp = data["stamp"].copy()
+
+    src = sources / "t2-2.csv"
+    src.write_text(src.read_text(encoding="utf-8").replace("30,4244,", "30,4000,", 1), encoding="utf-8")
+    _reset(monkeypatch)
+    assert tables.p_max_tabulated(30.0) == 4000.0
+    with np.load(sidecar) as data:
+        assert not np.array_equal(data["stamp"], old_stamp)
+        assert np.array_equal(data["stamp"], tables._sources_stamp(tables.T2_2_CSV, tables.T2_2_XLSX))
+        assert 4000.0 in data["ps"].tolist()
+
+    # The rebuilt sidecar is picked up on the next load
+    _reset(monkeypatch)
+    monkeypatch.setattr(tables, "_parse_pmax_table", lambda: False)
+    assert tables.p_max_tabulated(30.0) == 4000.0
+
+
+def _scalar_vs_vec(queries):
+    got = [tables.p_max_tabulated(float(t)) for t in queries]
+    want = tables.p_max_tabulated_vec(np.asarray(queries, dtype=np.float64)).tolist()
+    assert got == pytest.approx(want, rel=1e-12, abs=0.0)
+
+
+@pytest.fixture
+def pmax_nodes():
+    assert tables._ensure_pmax_table()
+    tables._pmax_hint.i = 0
+    yield np.array(tables._pmax_table[0])
+    tables._pmax_hint.i = 0
+
+
+def test_p_max_scalar_matches_vec_inside_and_at_nodes(pmax_nodes):
+    xs = pmax_nodes
+    mids = (xs[:-1] + xs[1:]) / 2
+    _scalar_vs_vec(mids)
+    _scalar_vs_vec(xs)
+    _scalar_vs_vec(xs[::-1])
+    # Just either side of every node
+    _scalar_vs_vec(np.nextafter(xs, -np.inf))
+    _scalar_vs_vec(np.nextafter(xs, np.inf))
+
+
+def test_p_max_scalar_matches_vec_outside_the_table(pmax_nodes):
+    xs = pmax_nodes
+    lo, hi = xs[0], xs[-1]
+    _scalar_vs_vec([lo - 100.0, lo - 1e-9, np.nextafter(lo, -np.inf), hi + 1e-9, hi + 100.0])
+    assert tables.p_max_tabulated(lo - 5.0) == tables._pmax_table[1][0]
+    assert tables.p_max_tabulated(hi + 5.0) == tables._pmax_table[1][-1]
+
+
+def test_p_max_scalar_matches_vec_in_any_order(pmax_nodes):
+    rng = np.random.default_rng(7)
+    xs = pmax_nodes
+    queries = rng.uniform(xs[0] - 2.0, xs[-1] + 2.0, 2000)
+    queries[::7] = rng.choice(xs, queries[::7].size)  # mix in exact nodes
+    _scalar_vs_vec(queries)
+    # Small steps back and forth exercise the neighbour-bracket shortcut
+    walk = np.clip(20.0 + np.cumsum(rng.choice([-0.1, -0.05, 0.05, 0.1], 2000)), xs[0], xs[-1])
+    _scalar_vs_vec(walk)
+
+
+def test_p_max_scalar_matches_vec_across_threads(pmax_nodes):
+    from concurrent.futures import ThreadPoolExecutor
+
+    xs = pmax_nodes
+    rng = np.random.default_rng(11)
+    batches = [rng.uniform(xs[0] - 1.0, xs[-1] + 1.0, 3000) for _ in range(8)]
+    batches[0] = np.sort(batches[0])
+    batches[1] = np.sort(batches[1])[::-1]
+
+    def run(qs):
+        return [tables.p_max_tabulated(float(t)) for t in qs]
+
+    with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+        results = list(pool.map(run, batches))
+    for qs, got in zip(batches, results):
+        assert got == pytest.approx(tables.p_max_tabulated_vec(qs).tolist(), rel=1e-12, abs=0.0)
+
+
+def test_p_max_stale_hint_after_smaller_table(monkeypatch):
+    _reset(monkeypatch)
+    monkeypatch.setattr(tables, "_pmax_loaded", True)
+    tables._set_pmax_table({0.0: 1.0, 1.0: 2.0, 2.0: 4.0})
+    tables._pmax_hint.i = 50
+    assert tables.p_max_tabulated(1.5) == 3.0
+    tables._pmax_hint.i = 2
+    assert tables.p_max_tabulated(1.5) == 3.0
+    tables._pmax_hint.i = 0
+
+
+def test_empty_pmax_table(monkeypatch):
+    _reset(monkeypatch)
+    monkeypatch.setattr(tables, "_pmax_loaded", True)
+    tables._set_pmax_table({})
+    assert tables.p_max_tabulated(20.0) is None
+    assert tables.p_max_tabulated_vec([20.0]) is None
+
+
+def test_empty_parse_is_unavailable_and_not_cached(sources, monkeypatch):
+    def parse_empty():
+        tables._set_pmax_table({})
+        return True
+
+    monkeypatch.setattr(tables, "_parse_pmax_table", parse_empty)
+    assert tables.p_max_tabulated(20.0) is None
+    assert tables._pmax_loaded is False
+    assert not (tables._CACHE_DIR / "t2-2.npz").exists()
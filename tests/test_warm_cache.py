@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from condensation import core
+
+
+@pytest.fixture
+def warm(tmp_path, monkeypatch):
+    """Point the warm cache at tmp_path, over a private copy of the tables."""
+    context = tmp_path / "context"
+    context.mkdir()
+    for src in (ROOT / "context").glob("t2-*"):
+        shutil.copy2(src, context / src.name)
+    monkeypatch.setattr(core, "_CONTEXT_DIR", context)
+    monkeypatch.setattr(core, "_WARM_PATH", tmp_path / "cache" / "table_lookups.json")
+    monkeypatch.setattr(core, "_warm_p_max", {})
+    monkeypatch.setattr(core, "_warm_theta_s", {})
+    return context
+
+
+def test_round_trip(warm):
+    core._warm_p_max[20.0] = 2337.0
+    core._warm_theta_s[(20.0, 65.0)] = 13.2
+    core._save_warm_cache()
+    data = json.loads(core._WARM_PATH.read_text(encoding="utf-8"))
+    assert data["stamp"][:4] == [
+        core._WARM_VERSION,
+        core._HAS_TABLES,
+        core._p_max_lookup.__name__,
+        core._theta_s_lookup.__name__,
+    ]
+    core._warm_p_max.clear()
+    core._warm_theta_s.clear()
+    core._load_warm_cache()
+    assert core._warm_p_max == {20.0: 2337.0}
+    assert core._warm_theta_s == {(20.0, 65.0): 13.2}
+
+
+def test_table_edit_invalidates(warm):
+    core._warm_p_max[20.0] = 2337.0
+    core._save_warm_cache()
+    core._warm_p_max.clear()
+    table = next(warm.glob("t2-*"))
+    table.write_text(table.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    core._load_warm_cache()
+    assert core._warm_p_max == {}
+
+
+def test_other_backend_invalidates(warm, monkeypatch):
+    core._warm_p_max[20.0] = 2337.0
+    core._save_warm_cache()
+    core._warm_p_max.clear()
+    other = core._p_max_grid_pa if core._p_max_lookup is not core._p_max_grid_pa else core._p_max_table_or_grid
+    monkeypatch.setattr(core, "_p_max_lookup", other)
+    core._load_warm_cache()
+    assert core._warm_p_max == {}
+
+
+def test_other_version_invalidates(warm, monkeypatch):
+    core._warm_p_max[20.0] = 2337.0
+    core._save_warm_cache()
+    core._warm_p_max.clear()
+    monkeypatch.setattr(core, "_WARM_VERSION", core._WARM_VERSION + 1)
+    core._load_warm_cache()
+    assert core._warm_p_max == {}
+
+
+def test_cache_dir_env_persists_across_processes(tmp_path):
+    env = dict(os.environ, TECCONDENSE_CACHE_DIR=str(tmp_path))
+    script = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "from condensation import core\n"
+        "n = len(core._warm_p_max)\n"
+        "core.p_max(12.34)\n"
+        "print(n)\n"
+    ) % str(ROOT)
+    first = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    assert first.stdout.strip() == "0"
+    assert (tmp_path / "table_lookups.json").exists()
+    second = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    assert int(second.stdout.strip()) >= 1
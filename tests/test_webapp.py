@@ -0,0 +1,115 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+pytest.importorskip("flask")
+
+from webapp import app as app_mod
+
+LAYER = {"name": "Insulation", "d": 0.1, "lambda_": 0.04, "mu": 20, "rho": 800, "xr_percent": 5, "xmax_percent": 20}
+CLIMATE = {"theta_i": 20, "phi_i": 65, "theta_e": -10, "phi_e": 90}
+
+
+@pytest.fixture(params=["orjson", "jsonify"])
+def client(request, monkeypatch):
+    """Test client with and without orjson."""
+    if request.param == "orjson":
+        if app_mod.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(app_mod, "orjson", None)
+    return app_mod.app.test_client()
+
+
+def _json(resp):
+    # Strict parse: NaN/Infinity literals are not JSON
+    def reject(token):
+        raise ValueError(f"non-standard JSON constant {token}")
+
+    assert resp.mimetype == "application/json"
+    return json.loads(resp.get_data(as_text=True), parse_constant=reject)
+
+
+def test_analyze_get_returns_usage(client):
+    resp = client.get("/analyze")
+    assert resp.status_code == 200
+    assert _json(resp) == app_mod._USAGE
+
+
+def test_analyze_post(client):
+    resp = client.post("/analyze", data=json.dumps({"layers": [LAYER], "Rsi": 0.13, "Rse": 0.04, "climate": CLIMATE}))
+    assert resp.status_code == 200
+    body = _json(resp)
+    assert body["ok"] is True
+    result = body["result"]
+    assert result["U"] == pytest.approx(1 / (0.13 + 0.1 / 0.04 + 0.04))
+    assert result["theta_i"] == 20.0 and result["theta_e"] == -10.0
+    assert result["layers"][0]["name"] == "Insulation"
+    assert len(result["theta_profile"]) == 2
+    assert result["z_axis"] == result["vapor_axis"]
+
+
+def test_analyze_post_non_finite_values_are_null(client):
+    # Zero total resistance: U = inf and q = NaN
+    layer = dict(LAYER, d=0.0)
+    resp = client.post("/analyze", data=json.dumps({"layers": [layer], "Rsi": 0, "Rse": 0, "climate": CLIMATE}))
+    assert resp.status_code == 200
+    result = _json(resp)["result"]
+    assert result["U"] is None
+    assert result["q"] is None
+
+
+def test_analyze_post_errors(client):
+    resp = client.post("/analyze", data=json.dumps({"layers": []}))
+    assert resp.status_code == 400
+    assert _json(resp) == {"ok": False, "error": "No layers provided"}
+
+    resp = client.post("/analyze", data=json.dumps({"layers": [{"name": "x"}]}))
+    assert resp.status_code == 400
+    assert _json(resp)["error"].startswith("Invalid layer at index 0")
+
+    resp = client.post("/analyze", data="not json")
+    assert resp.status_code == 500
+    assert _json(resp)["ok"] is False
+
+
+def test_materials(client, tmp_path, monkeypatch):
+    from condensation import materials
+
+    f = tmp_path / "materials.csv"
+    f.write_text(
+        "name,lambda,mu,rho,xr_percent,xmax_percent\nBrick,0.8,10,1800,1,2\nMineral wool,0.04,1,100,1,5\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(materials, "MATERIALS_CSV", f)
+    resp = client.get("/materials")
+    assert resp.status_code == 200
+    body = _json(resp)
+    assert body["ok"] is True
+    assert [m["name"] for m in body["materials"]] == ["Brick", "Mineral wool"]
+    assert body["materials"][0]["lambda_"] == 0.8
+
+    resp = client.get("/materials?q=WOOL")
+    assert [m["name"] for m in _json(resp)["materials"]] == ["Mineral wool"]
+
+
+def test_method_not_allowed(client):
+    resp = client.delete("/analyze")
+    assert resp.status_code == 405
+    assert _json(resp) == app_mod._METHOD_NOT_ALLOWED
+
+    resp = client.post("/")
+    assert resp.status_code == 303
+    assert resp.headers["Location"].endswith("/")
+
+
+def test_finite_or_none():
+    np = pytest.importorskip("numpy")
+    nan, inf = float("nan"), float("inf")
+    obj = {"a": nan, "b": [1.0, -inf, (2, nan)], "c": np.array([1.0, nan]), "d": np.float64(inf), "e": True}
+    assert app_mod._finite_or_none(obj) == {"a": None, "b": [1.0, None, [2, None]], "c": [1.0, None], "d": None, "e": True}
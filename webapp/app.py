@@ -1,20 +1,82 @@
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for
+import math
+import os
 import sys
 from pathlib import Path
 
-# Ensure repository root is on sys.path for package import
+# Running as a script (python webapp/app.py) puts webapp/ on sys.path, not
+# the repository root; imported as webapp.app the root is already there.
 ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.append(str(ROOT))
+if not __package__ and str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
 from condensation.core import analyze
 from condensation import report as report_mod
 from condensation.dataclasses import Layer, Assembly, Climate
 from condensation.materials import load_materials
 
+try:  # Optional fast JSON (de)serialization
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 app = Flask(__name__)
 
+
+def _json_default(obj):
+    # NumPy scalars/arrays that OPT_SERIALIZE_NUMPY does not cover
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _finite_or_none(obj):
+    """Copy of ``obj`` with NaN/±inf as None, as orjson writes them (null)."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite_or_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(v) for v in obj]
+    if hasattr(obj, 'tolist'):
+        return _finite_or_none(obj.tolist())
+    return obj
+
+
+def _json_response(obj, status: int = 200):
+    """JSON response via orjson when installed, otherwise Flask's jsonify.
+
+    Non-finite floats are encoded as ``null`` either way.
+    """
+    if orjson is None:
+        resp = jsonify(_finite_or_none(obj))
+        resp.status_code = status
+        return resp
+    body = orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return app.response_class(body, status=status, mimetype='application/json')
+
+
+def _request_json():
+    if orjson is None:
+        return request.get_json(force=True)
+    return orjson.loads(request.get_data(cache=False))
+
+
+# Static payloads, built once instead of on every request
+_USAGE = {
+    'ok': True,
+    'usage': 'POST JSON to this endpoint with {layers, Rsi, Rse, climate}',
+    'example': {
+        'layers': [{'name':'Insulation','d':0.1,'lambda_':0.04,'mu':20,'rho':800,'xr_percent':5,'xmax_percent':20}],
+        'Rsi': 0.13,
+        'Rse': 0.04,
+        'climate': {'theta_i':20,'phi_i':65,'theta_e':5,'phi_e':90}
+    }
+}
+_METHOD_NOT_ALLOWED = {'ok': False, 'error': 'Method Not Allowed', 'hint': 'GET / for UI, POST JSON to /analyze'}
+
+
 @app.route('/', methods=['GET'])
 def index():
     return render_template('index.html')
@@ -24,21 +86,12 @@ def index():
 def analyze_api():
     # Simple help on GET to avoid 405 if user navigates directly
     if request.method == 'GET':
-        return jsonify({
-            'ok': True,
-            'usage': 'POST JSON to this endpoint with {layers, Rsi, Rse, climate}',
-            'example': {
-                'layers': [{'name':'Insulation','d':0.1,'lambda_':0.04,'mu':20,'rho':800,'xr_percent':5,'xmax_percent':20}],
-                'Rsi': 0.13,
-                'Rse': 0.04,
-                'climate': {'theta_i':20,'phi_i':65,'theta_e':5,'phi_e':90}
-            }
-        })
+        return _json_response(_USAGE)
     try:
-        data = request.get_json(force=True)
+        data = _request_json()
         layers_in = data.get('layers', [])
         if not isinstance(layers_in, list) or not layers_in:
-            return jsonify({'ok': False, 'error': 'No layers provided'}), 400
+            return _json_response({'ok': False, 'error': 'No layers provided'}, 400)
         layers: list[Layer] = []
         for idx, L in enumerate(layers_in):
             try:
@@ -52,7 +105,7 @@ def analyze_api():
                     xmax_percent=float(L.get('xmax_percent', 20.0)),
                 ))
             except Exception as e:
-                return jsonify({'ok': False, 'error': f'Invalid layer at index {idx}: {e}'}), 400
+                return _json_response({'ok': False, 'error': f'Invalid layer at index {idx}: {e}'}, 400)
         Rsi = float(data.get('Rsi', 0.13))
         Rse = float(data.get('Rse', 0.04))
         assembly = Assembly(layers=layers, Rsi=Rsi, Rse=Rse)
@@ -95,9 +148,9 @@ def analyze_api():
             result["report_html"] = report_mod.report(result)
         except Exception as _:
             result["report_html"] = "<p>Report generation unavailable.</p>"
-        return jsonify({'ok': True, 'result': result})
+        return _json_response({'ok': True, 'result': result})
     except Exception as e:
-        return jsonify({'ok': False, 'error': str(e)}), 500
+        return _json_response({'ok': False, 'error': str(e)}, 500)
 
 
 @app.route('/materials', methods=['GET'])
@@ -107,7 +160,7 @@ def materials_api():
     if q:
         ql = q.lower()
         mats = [m for m in mats if ql in m.get('name','').lower()]
-    return jsonify({'ok': True, 'materials': mats})
+    return _json_response({'ok': True, 'materials': mats})
 
 
 @app.errorhandler(405)
@@ -115,7 +168,10 @@ def handle_405(e):
     # If someone POSTs to '/', redirect to the main page
     if request.path == '/':
         return redirect(url_for('index'), code=303)
-    return jsonify({'ok': False, 'error': 'Method Not Allowed', 'hint': 'GET / for UI, POST JSON to /analyze'}), 405
+    return _json_response(_METHOD_NOT_ALLOWED, 405)
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Development server only; set FLASK_DEBUG=1 for the debugger/reloader.
+    # For throughput serve with a WSGI server, e.g.
+    #   waitress-serve --listen=127.0.0.1:5000 webapp.app:app
+    app.run(debug=os.environ.get('FLASK_DEBUG', '0') == '1')